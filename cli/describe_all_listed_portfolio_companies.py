@@ -41,7 +41,7 @@ from rich.panel import Panel
 # Ensure project root on path so src.* imports work
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.artifacts import sanitize_filename
+from src.artifacts import sanitize_filename, load_state_snapshot
 from src.versioning import VersionManager
 
 
@@ -52,10 +52,8 @@ def load_artifacts(artifact_dir: Path, console: Console) -> dict:
     """
     artifacts: dict = {"state": None, "research": None}
 
-    state_file = artifact_dir / "state.json"
-    if state_file.exists():
-        with open(state_file) as f:
-            artifacts["state"] = json.load(f)
+    artifacts["state"] = load_state_snapshot(artifact_dir)
+    if artifacts["state"] is not None:
         console.print("[green]\u2713 Loaded state.json[/green]")
     else:
         console.print("[yellow]\u26a0 No state.json found[/yellow]")
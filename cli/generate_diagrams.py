@@ -33,7 +33,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.artifacts import sanitize_filename
+from src.artifacts import sanitize_filename, load_state_snapshot
 from src.agents.diagram_generator import (
     extract_market_sizing_data,
     render_tam_sam_som,
@@ -99,12 +99,8 @@ def resolve_output_dir(company_or_path: str, version: str = None, firm: str = No
 
 
 def load_state(output_dir: Path) -> dict:
-    """Load state.json from output directory."""
-    state_path = output_dir / "state.json"
-    if not state_path.exists():
-        return {}
-    with open(state_path) as f:
-        return json.load(f)
+    """Load state.json (or state.json.gz) from output directory."""
+    return load_state_snapshot(output_dir) or {}
 
 
 def extract_market_data_from_markdown(file_path: Path) -> dict:
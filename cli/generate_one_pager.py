@@ -30,7 +30,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.artifacts import sanitize_filename
+from src.artifacts import sanitize_filename, load_state_snapshot
 
 
 def resolve_output_dir(company_or_path: str, version: str = None, firm: str = None) -> Path:
@@ -84,13 +84,12 @@ def resolve_output_dir(company_or_path: str, version: str = None, firm: str = No
 
 
 def load_state(output_dir: Path) -> dict:
-    """Load state.json from output directory."""
-    state_path = output_dir / "state.json"
-    if not state_path.exists():
+    """Load state.json (or state.json.gz) from output directory."""
+    state = load_state_snapshot(output_dir)
+    if state is None:
         print(f"Warning: No state.json found in {output_dir}")
         return {}
-    with open(state_path) as f:
-        return json.load(f)
+    return state
 
 
 def main():
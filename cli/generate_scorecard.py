@@ -2,7 +2,6 @@
 
 import os
 import sys
-import json
 import argparse
 from pathlib import Path
 
@@ -14,18 +13,16 @@ from rich.panel import Panel
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.versioning import VersionManager
-from src.artifacts import sanitize_filename
+from src.artifacts import sanitize_filename, load_state_snapshot
 from src.state import MemoState
 from src.agents.scorecard_agent import scorecard_agent
 
 
 def load_state(artifact_dir: Path, console: Console) -> MemoState:
-    state_file = artifact_dir / "state.json"
-    if not state_file.exists():
+    state_data = load_state_snapshot(artifact_dir)
+    if state_data is None:
         console.print(f"[red]Error: state.json not found in {artifact_dir}[/red]")
         sys.exit(1)
-    with open(state_file) as f:
-        state_data = json.load(f)
     console.print("[green]✓ Loaded state.json[/green]")
     return state_data  # already matches MemoState structure persisted by workflow
 
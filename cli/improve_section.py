@@ -46,7 +46,7 @@ from rich.console import Console
 from rich.panel import Panel
 
 from src.state import MemoState
-from src.artifacts import sanitize_filename, save_section_artifact
+from src.artifacts import sanitize_filename, save_section_artifact, load_state_snapshot
 from src.versioning import VersionManager
 from src.paths import resolve_deal_context, get_latest_output_dir_for_deal, DealContext
 
@@ -94,11 +94,9 @@ def load_artifacts(artifact_dir: Path) -> dict:
         "validation": None,
     }
 
-    # Load state.json
-    state_file = artifact_dir / "state.json"
-    if state_file.exists():
-        with open(state_file) as f:
-            artifacts["state"] = json.load(f)
+    # Load state.json (or state.json.gz for large snapshots)
+    artifacts["state"] = load_state_snapshot(artifact_dir)
+    if artifacts["state"] is not None:
         console.print(f"[green]✓ Loaded state.json[/green]")
     else:
         console.print(f"[yellow]⚠ No state.json found[/yellow]")
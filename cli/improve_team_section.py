@@ -40,7 +40,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from src.artifacts import sanitize_filename, save_section_artifact
+from src.artifacts import sanitize_filename, save_section_artifact, load_state_snapshot
 from src.versioning import VersionManager
 
 
@@ -353,11 +353,9 @@ def load_artifacts(artifact_dir: Path, console: Console) -> dict:
         "deck_team": None,
     }
 
-    # Load state.json
-    state_file = artifact_dir / "state.json"
-    if state_file.exists():
-        with open(state_file) as f:
-            artifacts["state"] = json.load(f)
+    # Load state.json (or state.json.gz for large snapshots)
+    artifacts["state"] = load_state_snapshot(artifact_dir)
+    if artifacts["state"] is not None:
         console.print(f"[green]✓ Loaded state.json[/green]")
 
     # Load existing sections
@@ -47,7 +47,7 @@ from rich.panel import Panel
 # Ensure project root is on sys.path so `src.*` imports work when running from cli/
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.artifacts import sanitize_filename, save_section_artifact
+from src.artifacts import sanitize_filename, save_section_artifact, load_state_snapshot
 from src.versioning import VersionManager
 from src.paths import resolve_deal_context, get_latest_output_dir_for_deal, DealContext
 
@@ -90,10 +90,8 @@ def load_artifacts(artifact_dir: Path) -> dict:
         "validation": None,
     }
 
-    state_file = artifact_dir / "state.json"
-    if state_file.exists():
-        with open(state_file) as f:
-            artifacts["state"] = json.load(f)
+    artifacts["state"] = load_state_snapshot(artifact_dir)
+    if artifacts["state"] is not None:
         console.print("[green] Loaded state.json[/green]")
     else:
         console.print("[yellow] No state.json found[/yellow]")
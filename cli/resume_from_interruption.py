@@ -25,7 +25,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.state import MemoState, create_initial_state
 from src.utils import get_latest_output_dir
-from src.artifacts import sanitize_filename
+from src.artifacts import sanitize_filename, load_state_snapshot, reset_run_timestamp
 from src.paths import resolve_deal_context, get_latest_output_dir_for_deal, load_deal_config, DealContext
 
 
@@ -52,15 +52,13 @@ def detect_resume_point(output_dir: Path) -> str:
     # Check in reverse order (later checkpoints first)
 
     # Check if fully complete
-    state_json = output_dir / "state.json"
-    if state_json.exists() and _is_valid_json(state_json):
-        try:
-            with open(state_json) as f:
-                state = json.load(f)
-            if state.get("final_memo"):
-                return "complete"  # Already done
-        except (json.JSONDecodeError, KeyError):
-            pass
+    # (state.json, or state.json.gz for large snapshots)
+    try:
+        state = load_state_snapshot(output_dir)
+        if state and state.get("final_memo"):
+            return "complete"  # Already done
+    except (ValueError, OSError, EOFError):
+        pass  # Truncated or corrupt snapshot
 
     # Check for scorecard (runs after validate)
     scorecard_dir = output_dir / "5-scorecard"
@@ -356,6 +354,9 @@ def execute_from_checkpoint(state: MemoState, resume_from: str) -> MemoState:
     from src.agents.scorecard_evaluator import scorecard_evaluator_agent
     from src.workflow import finalize_memo, human_review, cleanup_research_citations, integrate_scorecard
 
+    # A resumed run is a new run: its reports take a fresh "Generated" timestamp
+    reset_run_timestamp()
+
     # Define agent sequence (matches workflow.py build_workflow() order)
     # Full sequence from workflow.py:
     # deck_analyst → research → section_research → cite → cleanup_research → draft →
@@ -444,8 +445,13 @@ def _is_valid_json(file_path: Path) -> bool:
         return False
 
 
-def main():
-    """Resume memo generation from last interruption."""
+def main(argv: Optional[list[str]] = None):
+    """Resume memo generation from last interruption.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]); lets
+            src.main dispatch --resume in-process
+    """
     parser = argparse.ArgumentParser(
         description="Resume memo generation from last checkpoint"
     )
@@ -470,7 +476,7 @@ def main():
         help="Specific version to resume (e.g., v0.0.3). Defaults to latest."
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Determine deal name and context
     ctx = None
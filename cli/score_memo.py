@@ -33,6 +33,7 @@ from src.scorecard_loader import (
     get_percentile_label,
     get_score_label,
 )
+from src.artifacts import load_state_snapshot
 from src.utils import get_latest_output_dir
 from src.paths import resolve_deal_context, get_latest_output_dir_for_deal, DealContext
 
@@ -93,11 +94,8 @@ def load_research(output_dir: Path) -> Dict[str, Any]:
 
 
 def load_state(output_dir: Path) -> Dict[str, Any]:
-    """Load state snapshot if available."""
-    state_file = output_dir / "state.json"
-    if state_file.exists():
-        return json.loads(state_file.read_text())
-    return {}
+    """Load state snapshot (state.json or state.json.gz) if available."""
+    return load_state_snapshot(output_dir) or {}
 
 
 def get_section_for_dimension(dimension_id: str, sections: Dict[str, str]) -> str:
@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from src.artifacts import load_state_snapshot
+
 
 def discover_firms(base_dir: Path = Path("io")) -> List[Dict]:
     """Discover all firms with deal directories."""
@@ -68,13 +70,12 @@ def discover_deals(firm: str, base_dir: Path = Path("io")) -> List[Dict]:
             for v in sorted(outputs_dir.iterdir()):
                 if v.is_dir() and "-v" in v.name:
                     version_str = v.name.split("-v")[-1]
-                    state_file = v / "state.json"
                     mod_time = datetime.fromtimestamp(v.stat().st_mtime)
                     versions.append({
                         "version": f"v{version_str}",
                         "path": str(v),
                         "date": mod_time.strftime("%Y-%m-%d"),
-                        "has_state": state_file.exists(),
+                        "has_state": (v / "state.json").exists() or (v / "state.json.gz").exists(),
                         "has_final_draft": bool(list(v.glob("7-*.md")) or list(v.glob("4-final-draft.md"))),
                         "has_one_pager": bool(list(v.glob("8-one-pager.*"))),
                     })
@@ -119,11 +120,8 @@ def get_latest_output_dir(deal_path: str) -> Optional[Path]:
 
 
 def load_state(output_dir: Path) -> Dict:
-    """Load state.json from an output directory."""
-    state_path = output_dir / "state.json"
-    if state_path.exists():
-        try:
-            return json.loads(state_path.read_text())
-        except json.JSONDecodeError:
-            return {}
-    return {}
+    """Load state.json (or state.json.gz) from an output directory."""
+    try:
+        return load_state_snapshot(output_dir) or {}
+    except (ValueError, OSError, EOFError):
+        return {}
@@ -12,14 +12,16 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.agents.citation_enrichment import citation_enrichment_agent
 from src.state import MemoState
+from src.artifacts import load_state_snapshot
 
 load_dotenv()
 
 # Load the existing memo and state
 output_dir = Path("output/Powerline-v0.0.1")
 
-with open(output_dir / "state.json") as f:
-    state_data = json.load(f)
+state_data = load_state_snapshot(output_dir)
+if state_data is None:
+    raise FileNotFoundError(f"No state.json or state.json.gz in {output_dir}")
 
 with open(output_dir / "1-research.json") as f:
     research_data = json.load(f)
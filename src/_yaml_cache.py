@@ -0,0 +1,59 @@
+"""
+Content-addressed cache for parsed YAML config files.
+
+Brand configs and correction files are frequently byte-identical across
+companies (shared brand config, copied correction templates). Parsed
+documents are keyed by a blake2b digest of the raw bytes, so identical
+content is only parsed once per process regardless of which path it was
+read from.
+
+Cached objects are shared between callers and must be treated as read-only.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Union
+
+import yaml
+
+# libyaml C loader when PyYAML was built with it; pure-Python loader otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_PARSED_CACHE: "OrderedDict[bytes, Any]" = OrderedDict()
+_PARSED_CACHE_MAX = 128
+_PARSED_CACHE_LOCK = threading.Lock()
+
+
+def load_yaml_cached(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a YAML file, reusing an earlier parse of identical content.
+
+    Args:
+        path: YAML file to load
+
+    Returns:
+        Parsed YAML document (shared; do not mutate)
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the content is not valid YAML
+    """
+    # Raw bytes: libyaml detects the encoding itself, skipping the text codec
+    with open(path, "rb") as f:
+        raw = f.read()
+    key = hashlib.blake2b(raw, digest_size=16).digest()
+
+    with _PARSED_CACHE_LOCK:
+        if key in _PARSED_CACHE:
+            _PARSED_CACHE.move_to_end(key)
+            return _PARSED_CACHE[key]
+
+    data = yaml.load(raw, Loader=YAML_LOADER)
+
+    with _PARSED_CACHE_LOCK:
+        _PARSED_CACHE[key] = data
+        if len(_PARSED_CACHE) > _PARSED_CACHE_MAX:
+            _PARSED_CACHE.popitem(last=False)
+    return data
@@ -35,6 +35,7 @@ from typing import Any, Dict
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 
+from ..artifacts import load_state_snapshot
 from ..state import MemoState
 from ..utils import get_latest_output_dir
 from .link_enrichment import link_enrichment_agent
@@ -131,17 +132,15 @@ def portfolio_listing_agent(state: MemoState) -> Dict[str, Any]:
         print(f"⊘ Portfolio listing skipped - no output directory for {company_name}")
         return {"messages": ["Portfolio listing skipped - no output directory"]}
 
-    state_file = output_dir / "state.json"
     research_file = output_dir / "1-research.json"
 
     state_data: Dict[str, Any] = {}
     research_data: Dict[str, Any] = {}
 
-    if state_file.exists():
-        try:
-            state_data = json.loads(state_file.read_text())
-        except Exception as e:
-            print(f"⚠ Failed to load state.json for portfolio listing: {e}")
+    try:
+        state_data = load_state_snapshot(output_dir) or {}
+    except Exception as e:
+        print(f"⚠ Failed to load state.json for portfolio listing: {e}")
 
     if research_file.exists():
         try:
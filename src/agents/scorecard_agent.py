@@ -175,7 +175,6 @@ def scorecard_agent(state: MemoState) -> Dict[str, Any]:
     # Load any existing section content to give the model richer context.
     sections = _load_section_snippets(output_dir)
 
-    state_path = output_dir / "state.json"
     research_path = output_dir / "1-research.json"
 
     if research_path.exists():
@@ -5,23 +5,30 @@ This agent is responsible for transforming research data into well-written
 memo sections that follow the Hypernova style guide and template structure.
 """
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
+from anthropic import Anthropic, APIError, InternalServerError, RateLimitError
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+import json
 import os
+import random
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set, Tuple
 
 from ..state import MemoState, SectionDraft
-from ..artifacts import sanitize_filename, save_section_artifact
+from ..artifacts import create_artifact_directory, sanitize_filename, save_section_artifact
+from ..paths import resolve_deal_context
 from ..versioning import VersionManager
 from ..outline_loader import load_outline_for_state
 from ..schemas.outline_schema import OutlineDefinition, SectionDefinition
 import re
 
 
+@lru_cache(maxsize=4)
 def load_template(investment_type: str = "direct") -> str:
     """
-    Load the appropriate memo template based on investment type.
+    Load the appropriate memo template based on investment type (cached per process).
 
     Args:
         investment_type: "direct" for startup investments, "fund" for LP commitments
@@ -44,64 +51,40 @@ def load_template(investment_type: str = "direct") -> str:
         return f.read()
 
 
+@lru_cache(maxsize=4)
 def load_style_guide() -> str:
-    """Load the style guide from file."""
+    """Load the style guide from file (cached per process)."""
     style_guide_path = Path(__file__).parent.parent.parent / "templates" / "style-guide.md"
     with open(style_guide_path, "r") as f:
         return f.read()
 
 
-def parse_memo_sections(memo_content: str) -> Dict[str, str]:
-    """
-    Parse memo into individual sections.
+# Citation / image patterns used to validate polished sections (alphanumeric keys
+# like [^1], [^deck], [^source_name])
+_CITATION_KEY_RE = re.compile(r'\[\^([a-zA-Z0-9_]+)\]')
+_INLINE_CITATION_KEY_RE = re.compile(r'\[\^([a-zA-Z0-9_]+)\](?!:)')
+_CITATION_DEF_KEY_RE = re.compile(r'^\[\^([a-zA-Z0-9_]+)\]:', re.MULTILINE)
+_IMAGE_EMBED_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
 
-    Args:
-        memo_content: Full memo markdown content
 
-    Returns:
-        Dictionary mapping section names to content
-    """
-    sections = {}
-
-    # Define the 10 expected sections with their markdown headers
-    section_patterns = [
-        (1, r"##\s*1\.\s*Executive Summary", "Executive Summary"),
-        (2, r"##\s*2\.\s*Business Overview", "Business Overview"),
-        (3, r"##\s*3\.\s*Market Context", "Market Context"),
-        (4, r"##\s*4\.\s*Technology & Product", "Technology & Product"),
-        (5, r"##\s*5\.\s*Traction & Milestones", "Traction & Milestones"),
-        (6, r"##\s*6\.\s*Team", "Team"),
-        (7, r"##\s*7\.\s*Funding & Terms", "Funding & Terms"),
-        (8, r"##\s*8\.\s*Risks & Mitigations", "Risks & Mitigations"),
-        (9, r"##\s*9\.\s*Investment Thesis", "Investment Thesis"),
-        (10, r"##\s*10\.\s*Recommendation", "Recommendation"),
-    ]
+@lru_cache(maxsize=1)
+def _get_client() -> Anthropic:
+    """Return a shared Anthropic client so its HTTP connection pool is reused across memos."""
+    return Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
 
-    # Split content by section headers
-    for i, (num, pattern, name) in enumerate(section_patterns):
-        # Find start of this section
-        match = re.search(pattern, memo_content, re.IGNORECASE)
-        if not match:
-            continue
-
-        start_pos = match.end()
-
-        # Find start of next section (or end of document)
-        if i + 1 < len(section_patterns):
-            next_pattern = section_patterns[i + 1][1]
-            next_match = re.search(next_pattern, memo_content[start_pos:], re.IGNORECASE)
-            if next_match:
-                end_pos = start_pos + next_match.start()
-            else:
-                end_pos = len(memo_content)
-        else:
-            end_pos = len(memo_content)
 
-        # Extract section content
-        section_content = memo_content[start_pos:end_pos].strip()
-        sections[name] = section_content
+@dataclass(frozen=True)
+class WriterModel:
+    """Anthropic client plus the generation settings used for every section call."""
+    client: Anthropic
+    model_name: str
+    max_tokens: int
+    temperature: float
 
-    return sections
+
+def _get_model(model_name: str, max_tokens: int, temperature: float) -> WriterModel:
+    """Bind generation settings to the shared Anthropic client."""
+    return WriterModel(_get_client(), model_name, max_tokens, temperature)
 
 
 # System prompt for Writer Agent (template/style guide will be appended at runtime)
@@ -152,7 +135,7 @@ def augment_section_draft(
     existing_draft: str,
     research: Dict[str, Any],
     deck_data: Dict[str, Any],
-    model: ChatAnthropic
+    model: WriterModel
 ) -> str:
     """
     Augment existing section draft with research findings.
@@ -189,63 +172,132 @@ Output the AUGMENTED section (300-500 words) in markdown format.
 Return ONLY the section content, no preamble.
 """
 
-    response = model.invoke(prompt)
-    return response.content
+    return _invoke_streaming(model, prompt)
 
 
-def polish_section_research(
-    section_def: SectionDefinition,
-    research_content: str,
-    company_name: str,
-    memo_mode: str,
-    style_guide: str,
-    model: ChatAnthropic
-) -> str:
+def retry_anthropic(max_retries: int = 3, base_delay: float = 2):
     """
-    Polish Perplexity research into final section while preserving citations.
+    Decorator that retries transient Anthropic API errors with jittered backoff.
 
-    This is the NEW approach: take research with citations and polish it.
+    Jitter keeps concurrent section calls from all retrying on the same tick
+    after a shared rate limit. The last error is re-raised once retries are
+    exhausted so callers can choose their own fallback.
 
     Args:
-        section_def: Section definition from outline
-        research_content: Research content with citations from Perplexity
-        company_name: Company name
-        memo_mode: Memo mode
-        style_guide: Style guide content
-        model: LLM model
+        max_retries: Total attempts before giving up
+        base_delay: Base delay in seconds (doubled each attempt)
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries):
+                try:
+                    return fn(*args, **kwargs)
+                except (InternalServerError, RateLimitError) as e:
+                    if attempt == max_retries - 1:
+                        print(f"      ❌ API error after {max_retries} attempts: {e}")
+                        raise
+                    wait_time = base_delay * (2 ** attempt) + random.uniform(0, 0.5 * 2 ** attempt)
+                    print(f"      ⚠️  API error (attempt {attempt + 1}/{max_retries}): {type(e).__name__}")
+                    print(f"      Retrying in {wait_time:.1f} seconds...")
+                    time.sleep(wait_time)
+        return wrapper
+    return decorator
+
+
+@retry_anthropic(max_retries=3, base_delay=2)
+def _invoke_streaming(model: WriterModel, prompt: str, stream_path: Optional[Path] = None) -> str:
+    """
+    Send a single-turn prompt, streaming text to stream_path as it arrives.
+
+    Writing while tokens are generated gives early on-disk progress for long
+    sections. Without a stream_path this is a plain messages.create call.
+
+    Args:
+        model: Anthropic client and generation settings
+        prompt: User prompt to send
+        stream_path: Optional file to write partial output to
 
     Returns:
-        Polished section content with preserved citations
+        Full response text (stripped)
     """
-    import re
+    params = {
+        "model": model.model_name,
+        "max_tokens": model.max_tokens,
+        "temperature": model.temperature,
+        "messages": [{"role": "user", "content": prompt}],
+    }
 
-    # Count citations before polishing (alphanumeric keys like [^1], [^deck], [^source_name])
-    all_citations_before = set(re.findall(r'\[\^([a-zA-Z0-9_]+)\]', research_content))
-    citations_before = len(all_citations_before)
+    if stream_path is None:
+        response = model.client.messages.create(**params)
+        return "".join(block.text for block in response.content if block.type == "text").strip()
 
-    # Find any embedded images in the research content
-    image_embeds = re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', research_content)
-    has_images = len(image_embeds) > 0
+    chunks = []
+    with open(stream_path, "w", encoding="utf-8") as f, model.client.messages.stream(**params) as stream:
+        for text in stream.text_stream:
+            f.write(text)
+            f.flush()
+            chunks.append(text)
+    return "".join(chunks).strip()
 
-    # Build mode guidance
-    mode_guidance = ""
-    if memo_mode == "justify":
-        mode_guidance = "MEMO MODE: Retrospective justification (recommend COMMIT)"
-    else:
-        mode_guidance = "MEMO MODE: Prospective analysis (recommend PASS/CONSIDER/COMMIT)"
 
-    # Get mode-specific emphasis if available
-    mode_specific = section_def.mode_specific.get(memo_mode)
-    if mode_specific:
-        mode_guidance += f"\nSection Emphasis: {mode_specific.emphasis}"
+def _approx_word_count(text: str) -> int:
+    """
+    Rough word count from space/newline counts, for progress output only.
 
-    target_words = section_def.target_length.ideal_words
+    Avoids allocating a list of words like len(text.split()) does, but blank
+    lines, double spaces and table padding each count as a word. Never gate
+    behavior on it; use len(text.split()) where the count must be exact.
+    """
+    if not text:
+        return 0
+    return text.count(" ") + text.count("\n") + 1
 
-    polish_prompt = f"""Rewrite the following Perplexity research into a polished "{section_def.name}" section for {company_name}.
 
-PERPLEXITY RESEARCH (with citations):
-{research_content}
+def _analyze_citations(content: str) -> Tuple[Set[str], bool]:
+    """
+    Scan content once for citation keys and the "### Citations" header.
+
+    The header lives at the end of a section, so it is located with rfind.
+
+    Returns:
+        Tuple of (citation keys, has citations header)
+    """
+    return set(_CITATION_KEY_RE.findall(content)), content.rfind("### Citations") != -1
+
+
+def research_meets_style_targets(section_def: SectionDefinition, research_content: str) -> bool:
+    """
+    Cheap heuristic check for whether research can be used as-is without polishing.
 
+    Passes when the prose is within the outline's word-count range, a
+    "### Citations" block is present, and every inline citation key has a
+    matching definition.
+
+    Args:
+        section_def: Section definition from outline
+        research_content: Research content with citations from Perplexity
+
+    Returns:
+        True if the research already meets the section's style targets
+    """
+    citations_pos = research_content.rfind("### Citations")
+    if citations_pos == -1:
+        return False
+
+    # Exact word count of the prose above the citation block; this gates a skip
+    word_count = len(research_content[:citations_pos].split())
+    target = section_def.target_length
+    if not (target.min_words <= word_count <= target.max_words):
+        return False
+
+    inline_keys = set(_INLINE_CITATION_KEY_RE.findall(research_content))
+    definition_keys = set(_CITATION_DEF_KEY_RE.findall(research_content))
+    return bool(inline_keys) and inline_keys <= definition_keys
+
+
+# Static spans of the polish prompt, built once at import.
+_POLISH_VC_MINDSET = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║ VENTURE CAPITAL MINDSET (not Private Equity)                                ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
@@ -266,7 +318,79 @@ PE FRAMING (what to avoid):
 
 Observations and conclusions are GOOD - just frame them as opportunity, not skepticism.
 
-SECTION REQUIREMENTS:
+"""
+
+_POLISH_EDIT_RULES = """
+WHAT YOU CAN DO:
+- Reorder sentences and paragraphs
+- Improve transitions and flow
+- Add subsection headers
+- Use bullet points for readability
+- Rephrase for clarity
+
+WHAT YOU CANNOT DO:
+- Remove or change citation markers [^N]
+- Remove the "### Citations" section
+- Change citation format or spacing
+- Add new factual claims without citations
+- Change specific numbers or dates
+- Consolidate multiple citations into one
+- Remove or modify image embeds ![...](...)
+
+"""
+
+
+def build_polish_prompt(
+    section_def: SectionDefinition,
+    research_content: str,
+    company_name: str,
+    memo_mode: str,
+    style_guide: str
+) -> str:
+    """
+    Build the prompt that polishes Perplexity research into a section.
+
+    Args:
+        section_def: Section definition from outline
+        research_content: Research content with citations from Perplexity
+        company_name: Company name
+        memo_mode: Memo mode
+        style_guide: Style guide excerpt (pre-sliced once per memo by writer_agent)
+
+    Returns:
+        Polish prompt string
+    """
+    # Count citations before polishing (alphanumeric keys like [^1], [^deck], [^source_name])
+    all_citations_before, _ = _analyze_citations(research_content)
+    citations_before = len(all_citations_before)
+
+    # Find any embedded images in the research content
+    image_embeds = _IMAGE_EMBED_RE.findall(research_content)
+    has_images = len(image_embeds) > 0
+
+    # Build mode guidance
+    mode_guidance = ""
+    if memo_mode == "justify":
+        mode_guidance = "MEMO MODE: Retrospective justification (recommend COMMIT)"
+    else:
+        mode_guidance = "MEMO MODE: Prospective analysis (recommend PASS/CONSIDER/COMMIT)"
+
+    # Get mode-specific emphasis if available
+    mode_specific = section_def.mode_specific.get(memo_mode)
+    if mode_specific:
+        mode_guidance += f"\nSection Emphasis: {mode_specific.emphasis}"
+
+    target_words = section_def.target_length.ideal_words
+    section_header = f"## {section_def.number}. {section_def.name}"
+    citation_keys = f"{list(all_citations_before)[:10]}{'...' if len(all_citations_before) > 10 else ''}"
+
+    parts = [
+        f'Rewrite the following Perplexity research into a polished "{section_def.name}" section for {company_name}.\n\n',
+        "PERPLEXITY RESEARCH (with citations):\n",
+        research_content,
+        "\n",
+        _POLISH_VC_MINDSET,
+        f"""SECTION REQUIREMENTS:
 - Target length: {target_words} words
 - Analytical tone (not promotional, not PE-skeptical)
 - Organized with clear subsections
@@ -277,73 +401,53 @@ CITATION PRESERVATION (CRITICAL - WILL BE VALIDATED):
 - PRESERVE ALL {citations_before} CITATIONS EXACTLY - DO NOT REMOVE ANY
 - Citations may be numeric [^1] or alphanumeric [^deck] - preserve ALL of them
 - Keep citation format: ". [^key]" (space before bracket, after punctuation)
-- Keep ALL citation keys exactly as they appear: {list(all_citations_before)[:10]}{'...' if len(all_citations_before) > 10 else ''}
+- Keep ALL citation keys exactly as they appear: {citation_keys}
 - DO NOT consolidate or remove "redundant" citations
 - DO NOT renumber or rename citations - [^deck] MUST stay [^deck], [^1] MUST stay [^1]
 - If a sentence has multiple citations [^1] [^deck], keep ALL of them
 - INCLUDE the complete "### Citations" section at the end with ALL definitions
 - COPY the citation definitions EXACTLY as they appear in the input (same keys, same text)
-{"" if not has_images else f'''
+""",
+    ]
+    if has_images:
+        parts.append(f"""
 IMAGE PRESERVATION (CRITICAL):
 - PRESERVE ALL {len(image_embeds)} IMAGE EMBED(S) EXACTLY - DO NOT REMOVE ANY
 - Keep image format: ![description](absolute/path/to/image.png)
 - Place each image at the TOP of the section, before the text content
 - These are screenshots from the company's pitch deck - they add credibility
 - DO NOT modify the image paths
-'''}
-STYLE GUIDANCE:
-{style_guide[:1000]}
-
-WHAT YOU CAN DO:
-- Reorder sentences and paragraphs
-- Improve transitions and flow
-- Add subsection headers
-- Use bullet points for readability
-- Rephrase for clarity
-
-WHAT YOU CANNOT DO:
-- Remove or change citation markers [^N]
-- Remove the "### Citations" section
-- Change citation format or spacing
-- Add new factual claims without citations
-- Change specific numbers or dates
-- Consolidate multiple citations into one
-- Remove or modify image embeds ![...](...)
-
-VALIDATION: Your output will be checked to ensure ALL {citations_before} citations are preserved. If any are missing, the output will be rejected.
-
-Output the polished section content (no section header "## {section_def.number}. {section_def.name}") followed by the complete "### Citations" section.
-"""
-
-    # Invoke with retry logic for transient API errors
-    import time
-    from anthropic import InternalServerError, RateLimitError
+""")
+    parts.extend([
+        "\nSTYLE GUIDANCE:\n",
+        style_guide,
+        "\n",
+        _POLISH_EDIT_RULES,
+        f"VALIDATION: Your output will be checked to ensure ALL {citations_before} citations are preserved. If any are missing, the output will be rejected.\n\n",
+        f'Output the polished section content (no section header "{section_header}") followed by the complete "### Citations" section.\n',
+    ])
+    return "".join(parts)
+
+
+def validate_polished_section(research_content: str, polished_content: str) -> str:
+    """
+    Check that polishing preserved citations and images.
 
-    max_retries = 3
-    retry_delay = 2  # seconds
+    Args:
+        research_content: Original research content with citations
+        polished_content: LLM-polished section content
 
-    for attempt in range(max_retries):
-        try:
-            response = model.invoke(polish_prompt)
-            polished_content = response.content.strip()
-            break  # Success, exit retry loop
-        except (InternalServerError, RateLimitError) as e:
-            if attempt < max_retries - 1:
-                wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                print(f"      ⚠️  API error (attempt {attempt + 1}/{max_retries}): {type(e).__name__}")
-                print(f"      Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
-            else:
-                print(f"      ❌ API error after {max_retries} attempts: {e}")
-                print(f"      Using original research content without polishing")
-                return research_content  # Fallback to original research
-        except Exception as e:
-            print(f"      ❌ Unexpected error during polishing: {e}")
-            print(f"      Using original research content without polishing")
-            return research_content  # Fallback to original research
+    Returns:
+        Polished content (with any dropped images restored), or the original
+        research content if citations were lost or renamed
+    """
+    all_citations_before, _ = _analyze_citations(research_content)
+    citations_before = len(all_citations_before)
+    image_embeds = _IMAGE_EMBED_RE.findall(research_content)
+    has_images = len(image_embeds) > 0
 
     # Validate citations preserved (alphanumeric keys)
-    all_citations_after = set(re.findall(r'\[\^([a-zA-Z0-9_]+)\]', polished_content))
+    all_citations_after, has_citations_header = _analyze_citations(polished_content)
     citations_after = len(all_citations_after)
 
     # Check if we lost citations
@@ -351,33 +455,33 @@ Output the polished section content (no section header "## {section_def.number}.
     if lost_citations:
         print(f"      ⚠️  WARNING: Citation mismatch! Before: {citations_before}, After: {citations_after}")
         print(f"      Lost citations: {lost_citations}")
-        print(f"      Using original research content to preserve citations")
+        print("      Using original research content to preserve citations")
         # Fall back to original research if citations were lost
         return research_content
 
     # Validate citation list exists
-    if "### Citations" not in polished_content:
-        print(f"      ⚠️  WARNING: Citation list missing! Using original research")
+    if not has_citations_header:
+        print("      ⚠️  WARNING: Citation list missing! Using original research")
         return research_content
 
     # Validate citation DEFINITIONS exist (not just the header)
     # Count definitions in original research
-    defs_before = len(re.findall(r'^\[\^[a-zA-Z0-9_]+\]:', research_content, re.MULTILINE))
-    defs_after = len(re.findall(r'^\[\^[a-zA-Z0-9_]+\]:', polished_content, re.MULTILINE))
+    defs_before = sum(1 for _ in _CITATION_DEF_KEY_RE.finditer(research_content))
+    defs_after = sum(1 for _ in _CITATION_DEF_KEY_RE.finditer(polished_content))
 
     if defs_before > 0 and defs_after == 0:
         print(f"      ⚠️  WARNING: Citation definitions lost! Before: {defs_before}, After: {defs_after}")
-        print(f"      Using original research content to preserve citations")
+        print("      Using original research content to preserve citations")
         return research_content
 
     if defs_after < defs_before * 0.5:  # Lost more than half
         print(f"      ⚠️  WARNING: Too many citation definitions lost! Before: {defs_before}, After: {defs_after}")
-        print(f"      Using original research content to preserve citations")
+        print("      Using original research content to preserve citations")
         return research_content
 
     # Validate that definition keys match inline citation keys
-    inline_keys_after = set(re.findall(r'\[\^([a-zA-Z0-9_]+)\](?!:)', polished_content))
-    definition_keys_after = set(re.findall(r'^\[\^([a-zA-Z0-9_]+)\]:', polished_content, re.MULTILINE))
+    inline_keys_after = set(_INLINE_CITATION_KEY_RE.findall(polished_content))
+    definition_keys_after = set(_CITATION_DEF_KEY_RE.findall(polished_content))
 
     # Check if LLM renumbered citations (inline keys don't match original)
     if inline_keys_after != all_citations_before:
@@ -385,19 +489,19 @@ Output the polished section content (no section header "## {section_def.number}.
         if renamed_keys:
             print(f"      ⚠️  WARNING: LLM renamed citation keys! New keys: {renamed_keys}")
             print(f"      Original keys were: {all_citations_before}")
-            print(f"      Using original research content to preserve citations")
+            print("      Using original research content to preserve citations")
             return research_content
 
     # Check if definitions match inline references
     missing_defs = inline_keys_after - definition_keys_after
     if missing_defs:
         print(f"      ⚠️  WARNING: Missing definitions for inline citations: {missing_defs}")
-        print(f"      Using original research content to preserve citations")
+        print("      Using original research content to preserve citations")
         return research_content
 
     # Validate images preserved (if any existed)
     if has_images:
-        images_after = re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', polished_content)
+        images_after = _IMAGE_EMBED_RE.findall(polished_content)
         if len(images_after) < len(image_embeds):
             print(f"      ⚠️  WARNING: Image embeds lost! Before: {len(image_embeds)}, After: {len(images_after)}")
             # Prepend missing images to the content
@@ -413,39 +517,80 @@ Output the polished section content (no section header "## {section_def.number}.
     return polished_content
 
 
-def write_single_section(
+def polish_section_research(
     section_def: SectionDefinition,
-    research: Dict[str, Any],
+    research_content: str,
+    company_name: str,
+    memo_mode: str,
+    style_guide: str,
+    model: WriterModel,
+    stream_path: Optional[Path] = None
+) -> str:
+    """
+    Polish Perplexity research into final section while preserving citations.
+
+    This is the NEW approach: take research with citations and polish it.
+
+    Args:
+        section_def: Section definition from outline
+        research_content: Research content with citations from Perplexity
+        company_name: Company name
+        memo_mode: Memo mode
+        style_guide: Style guide excerpt (pre-sliced once per memo by writer_agent)
+        model: LLM model
+        stream_path: Optional file to stream the raw response to while it generates
+
+    Returns:
+        Polished section content with preserved citations
+    """
+    # Opt-in short-circuit: skip the LLM round-trip when research is already clean
+    if os.getenv("WRITER_SKIP_POLISH_IF_CLEAN", "false").lower() in ("1", "true"):
+        if research_meets_style_targets(section_def, research_content):
+            print("      Research already meets style targets - skipping polish")
+            return research_content
+
+    polish_prompt = build_polish_prompt(
+        section_def, research_content, company_name, memo_mode, style_guide
+    )
+
+    # Invoke (retries transient API errors via retry_anthropic)
+    try:
+        polished_content = _invoke_streaming(model, polish_prompt, stream_path)
+    except (InternalServerError, RateLimitError):
+        print(f"      Using original research content without polishing")
+        return research_content  # Fallback to original research
+    except Exception as e:
+        print(f"      ❌ Unexpected error during polishing: {e}")
+        print(f"      Using original research content without polishing")
+        return research_content  # Fallback to original research
+
+    return validate_polished_section(research_content, polished_content)
+
+
+def build_section_prompt(
+    section_def: SectionDefinition,
+    research_json: str,
     company_name: str,
     investment_type: str,
     memo_mode: str,
     style_guide: str,
-    model: ChatAnthropic,
     current_date: str
 ) -> str:
     """
-    Write a single section of the memo using outline guidance.
-
-    NOTE: This is the FALLBACK approach when section research doesn't exist.
-    Prefer polish_section_research() when Perplexity research files are available.
+    Build the prompt that writes a section from scratch using outline guidance.
 
     Args:
         section_def: Section definition from outline (with guiding questions, vocabulary)
-        research: Research data
+        research_json: Research data, pre-serialized and truncated once per memo
         company_name: Company name
         investment_type: Investment type
         memo_mode: Memo mode
         style_guide: Style guide content
-        model: LLM model
         current_date: Current date string
 
     Returns:
-        Section content as markdown
+        Section prompt string
     """
-    import json
-
-    research_json = json.dumps(research, indent=2)[:3000]  # Limit research to 3k chars
-
     # Get mode-specific guidance from outline
     mode_specific = section_def.mode_specific.get(memo_mode)
     mode_guidance = ""
@@ -483,7 +628,7 @@ PASS, CONSIDER, or COMMIT based on the objective analysis of strengths vs. risks
     # Target length
     target_length = section_def.target_length.ideal_words
 
-    user_prompt = f"""Write ONLY the "{section_def.name}" section for an investment memo about {company_name}.
+    return f"""Write ONLY the "{section_def.name}" section for an investment memo about {company_name}.
 
 CURRENT DATE: {current_date}
 INVESTMENT TYPE: {investment_type.upper()}
@@ -590,29 +735,138 @@ Target: {target_length} words (min: {section_def.target_length.min_words}, max:
 SECTION CONTENT:
 """
 
-    # Invoke with retry logic for transient API errors
-    import time
-    from anthropic import InternalServerError, RateLimitError
 
-    max_retries = 3
-    retry_delay = 2  # seconds
+def write_single_section(
+    section_def: SectionDefinition,
+    research_json: str,
+    company_name: str,
+    investment_type: str,
+    memo_mode: str,
+    style_guide: str,
+    model: WriterModel,
+    current_date: str,
+    stream_path: Optional[Path] = None
+) -> str:
+    """
+    Write a single section of the memo using outline guidance.
+
+    NOTE: This is the FALLBACK approach when section research doesn't exist.
+    Prefer polish_section_research() when Perplexity research files are available.
+
+    Args:
+        section_def: Section definition from outline (with guiding questions, vocabulary)
+        research_json: Research data, pre-serialized and truncated once per memo
+        company_name: Company name
+        investment_type: Investment type
+        memo_mode: Memo mode
+        style_guide: Style guide content
+        model: LLM model
+        current_date: Current date string
+        stream_path: Optional file to stream the raw response to while it generates
+
+    Returns:
+        Section content as markdown
+    """
+    user_prompt = build_section_prompt(
+        section_def, research_json, company_name, investment_type,
+        memo_mode, style_guide, current_date
+    )
+
+    # Invoke (retries transient API errors via retry_anthropic)
+    try:
+        return _invoke_streaming(model, user_prompt, stream_path)
+    except (InternalServerError, RateLimitError):
+        raise  # Already reported by retry_anthropic after all retries
+    except Exception as e:
+        print(f"      ❌ Unexpected error during writing: {e}")
+        raise  # Re-raise unexpected errors
+
+
+def run_message_batch(
+    prompts: Dict[str, str],
+    model_name: str,
+    max_tokens: int,
+    temperature: float,
+    poll_interval: float = 10.0,
+    max_poll_interval: float = 60.0,
+    max_wait: float = 3600.0
+) -> Dict[str, str]:
+    """
+    Submit prompts as one Anthropic Message Batch and wait for the results.
+
+    Batches are billed at a discount and scheduled server-side, at the cost of
+    latency - suited to unattended/nightly runs. If the batch can't be submitted,
+    or hasn't ended within max_wait (it is then cancelled), an empty mapping is
+    returned and every section falls back to the sequential path.
+
+    Args:
+        prompts: Mapping of custom_id to user prompt
+        model_name: Anthropic model name
+        max_tokens: Max tokens per response
+        temperature: Sampling temperature
+        poll_interval: Initial seconds between status polls (doubles each poll)
+        max_poll_interval: Upper bound on seconds between polls
+        max_wait: Seconds to wait for the batch to end before cancelling it
 
-    for attempt in range(max_retries):
+    Returns:
+        Mapping of custom_id to response text for requests that succeeded.
+        Errored/expired requests are omitted so callers can retry them.
+    """
+    client = _get_client()
+    try:
+        batch = client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": custom_id,
+                    "params": {
+                        "model": model_name,
+                        "max_tokens": max_tokens,
+                        "temperature": temperature,
+                        "messages": [{"role": "user", "content": prompt}],
+                    },
+                }
+                for custom_id, prompt in prompts.items()
+            ]
+        )
+    except APIError as e:
+        print(f"   ⚠️  Message batch submission failed ({e}) - will write sequentially")
+        return {}
+    print(f"   📦 Submitted message batch {batch.id} ({len(prompts)} sections)")
+
+    deadline = time.monotonic() + max_wait
+    delay = poll_interval
+    while batch.processing_status != "ended":
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            print(f"   ⚠️  Message batch {batch.id} still running after {max_wait:.0f}s - cancelling, will write sequentially")
+            try:
+                client.messages.batches.cancel(batch.id)
+            except APIError as e:
+                print(f"   ⚠️  Could not cancel message batch {batch.id}: {e}")
+            return {}
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_poll_interval)
         try:
-            response = model.invoke(user_prompt)
-            return response.content.strip()
-        except (InternalServerError, RateLimitError) as e:
-            if attempt < max_retries - 1:
-                wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
-                print(f"      ⚠️  API error (attempt {attempt + 1}/{max_retries}): {type(e).__name__}")
-                print(f"      Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
+            batch = client.messages.batches.retrieve(batch.id)
+        except APIError as e:
+            # Transient status errors: keep polling until the deadline
+            print(f"   ⚠️  Polling message batch {batch.id} failed ({e}) - retrying")
+
+    results = {}
+    try:
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = "".join(
+                    block.text for block in entry.result.message.content if block.type == "text"
+                ).strip()
             else:
-                print(f"      ❌ API error after {max_retries} attempts: {e}")
-                raise  # Re-raise after all retries exhausted
-        except Exception as e:
-            print(f"      ❌ Unexpected error during writing: {e}")
-            raise  # Re-raise unexpected errors
+                print(f"   ⚠️  Batch request {entry.custom_id} {entry.result.type} - will write sequentially")
+    except APIError as e:
+        # Keep what was read; the remaining sections are written sequentially
+        print(f"   ⚠️  Reading message batch {batch.id} results failed ({e}) - will write sequentially")
+
+    print(f"   ✓ Message batch complete: {len(results)}/{len(prompts)} succeeded\n")
+    return results
 
 
 def writer_agent(state: MemoState) -> Dict[str, Any]:
@@ -635,23 +889,41 @@ def writer_agent(state: MemoState) -> Dict[str, Any]:
     investment_type = state.get("investment_type", "direct")
     memo_mode = state.get("memo_mode", "consider")
 
-    # Load outline (with terminal output showing which outline is loaded)
-    outline = load_outline_for_state(state)
+    firm = state.get("firm")
+    existing_output_dir = state.get("output_dir")
 
-    # Load style guide (still used for general writing guidance)
-    style_guide = load_style_guide()
+    # Outline, style guide and deal context are independent disk reads - load
+    # them concurrently. Deal context is only needed when creating a new
+    # firm-scoped output directory.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Load outline (with terminal output showing which outline is loaded)
+        outline_future = executor.submit(load_outline_for_state, state)
+        # Load style guide (still used for general writing guidance)
+        style_guide_future = executor.submit(load_style_guide)
+        ctx_future = (
+            executor.submit(resolve_deal_context, company_name, firm=firm)
+            if firm and not existing_output_dir else None
+        )
+        outline = outline_future.result()
+        style_guide = style_guide_future.result()
+        ctx = ctx_future.result() if ctx_future else None
+
+    # The polish prompt only uses the first 1000 chars - slice once per memo.
+    style_guide_excerpt = style_guide[:1000]
 
     # Initialize Claude
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY environment variable not set")
 
-    model = ChatAnthropic(
-        model=os.getenv("DEFAULT_MODEL", "claude-sonnet-4-5-20250929"),
-        api_key=api_key,
-        temperature=0.7,
-        max_tokens=4000  # Smaller context per section
-    )
+    model_name = os.getenv("DEFAULT_MODEL", "claude-sonnet-4-5-20250929")
+    max_tokens = 4000  # Smaller context per section
+    temperature = 0.7
+    model = _get_model(model_name, max_tokens, temperature)
+
+    # "sequential" (default) invokes per section; "batch" submits every section
+    # as one Message Batch (cheaper, higher latency)
+    writer_mode = os.getenv("WRITER_MODE", "sequential").lower()
 
     # Get current date
     from datetime import datetime
@@ -659,21 +931,15 @@ def writer_agent(state: MemoState) -> Dict[str, Any]:
 
     # Get version manager and output directory - firm-aware
     # IMPORTANT: Check for existing output_dir first (set by resume script)
-    from ..paths import resolve_deal_context
-    from ..artifacts import create_artifact_directory
-
-    firm = state.get("firm")
     safe_name = sanitize_filename(company_name)
 
     # Check if output_dir already set (e.g., by resume script)
-    existing_output_dir = state.get("output_dir")
     if existing_output_dir:
         output_dir = Path(existing_output_dir)
         print(f"   Using existing output directory: {output_dir}")
         # Ensure 2-sections directory exists
         (output_dir / "2-sections").mkdir(parents=True, exist_ok=True)
     elif firm:
-        ctx = resolve_deal_context(company_name, firm=firm)
         version_mgr = VersionManager(ctx.outputs_dir.parent if ctx.outputs_dir else Path("output"), firm=firm)
         version = version_mgr.get_next_version(safe_name)
         output_dir = create_artifact_directory(company_name, str(version), firm=firm)
@@ -681,7 +947,7 @@ def writer_agent(state: MemoState) -> Dict[str, Any]:
         version_mgr = VersionManager(Path("output"))
         version = version_mgr.get_next_version(safe_name)
         output_dir = Path("output") / f"{safe_name}-{version}"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        (output_dir / "2-sections").mkdir(parents=True, exist_ok=True)
 
     print(f"\n📝 Writing memo sections using outline guidance...")
     print(f"   Outline: {outline.metadata.outline_type} v{outline.metadata.version}")
@@ -692,10 +958,50 @@ def writer_agent(state: MemoState) -> Dict[str, Any]:
     # Check for research directory with Perplexity section research
     research_dir = output_dir / "1-research"
     has_section_research = research_dir.exists()
+    # One directory listing instead of a stat per section (matters on network filesystems)
+    available_research = set(os.listdir(research_dir)) if has_section_research else set()
 
     if has_section_research:
         print(f"   ℹ️  Found section research directory - will polish Perplexity research\n")
 
+    # Paths reused by every section, built once
+    sections_dir = output_dir / "2-sections"
+
+    # Research summary for the fallback path - serialized at most once per memo
+    research_json = None
+
+    # Batch mode: build every section prompt up front and submit them together.
+    # Sections missing from the results fall through to the sequential path below.
+    research_contents: Dict[int, str] = {}
+    batch_results: Dict[str, str] = {}
+    if writer_mode == "batch":
+        skip_if_clean = os.getenv("WRITER_SKIP_POLISH_IF_CLEAN", "false").lower() in ("1", "true")
+        batch_prompts = {}
+        for section_def in outline.sections:
+            research_filename = section_def.filename.replace(".md", "-research.md")
+            if research_filename in available_research:
+                research_content = (research_dir / research_filename).read_text()
+                research_contents[section_def.number] = research_content
+                if skip_if_clean and research_meets_style_targets(section_def, research_content):
+                    continue
+                prompt = build_polish_prompt(
+                    section_def, research_content, company_name, memo_mode, style_guide_excerpt
+                )
+            else:
+                if research_json is None:
+                    research_json = json.dumps(research, separators=(",", ":"))[:3000]
+                prompt = build_section_prompt(
+                    section_def, research_json, company_name, investment_type,
+                    memo_mode, style_guide, current_date
+                )
+            batch_prompts[f"section-{section_def.number}"] = prompt
+
+        if batch_prompts:
+            batch_results = run_message_batch(
+                batch_prompts, model_name, max_tokens, temperature,
+                max_wait=float(os.getenv("WRITER_BATCH_MAX_WAIT", "3600"))
+            )
+
     # Write each section iteratively using outline definitions
     total_words = 0
     sections_polished = 0
@@ -710,56 +1016,79 @@ def writer_agent(state: MemoState) -> Dict[str, Any]:
 
         # Check if Perplexity section research exists
         research_filename = section_def.filename.replace(".md", "-research.md")
-        research_file = research_dir / research_filename if has_section_research else None
-
-        if research_file and research_file.exists():
-            # NEW PATH: Polish Perplexity research with citations
-            print(f"      Found research file - polishing with citation preservation...")
-            research_content = research_file.read_text()
-
-            section_content = polish_section_research(
-                section_def=section_def,
-                research_content=research_content,
-                company_name=company_name,
-                memo_mode=memo_mode,
-                style_guide=style_guide,
-                model=model
-            )
-            sections_polished += 1
-        else:
-            # FALLBACK: Write from scratch using general research
-            print(f"      No research file - writing from general research...")
-            section_content = write_single_section(
-                section_def=section_def,
-                research=research,
-                company_name=company_name,
-                investment_type=investment_type,
-                memo_mode=memo_mode,
-                style_guide=style_guide,
-                model=model,
-                current_date=current_date
-            )
-            sections_written += 1
+        # Raw LLM output streams here while generating; removed once the
+        # section is saved or has failed (.partial so section globs skip it)
+        stream_path = sections_dir / f"{section_def.filename}.partial"
 
-        # Save individual section
-        save_section_artifact(output_dir, section_num, section_name, section_content)
-        word_count = len(section_content.split())
+        try:
+            batched_content = batch_results.get(f"section-{section_num}")
+
+            if research_filename in available_research:
+                # NEW PATH: Polish Perplexity research with citations
+                research_content = research_contents.get(section_num) or (research_dir / research_filename).read_text()
+
+                if batched_content is not None:
+                    print("      Validating batch-polished research...")
+                    section_content = validate_polished_section(research_content, batched_content)
+                else:
+                    print(f"      Found research file - polishing with citation preservation...")
+                    section_content = polish_section_research(
+                        section_def=section_def,
+                        research_content=research_content,
+                        company_name=company_name,
+                        memo_mode=memo_mode,
+                        style_guide=style_guide_excerpt,
+                        model=model,
+                        stream_path=stream_path
+                    )
+                sections_polished += 1
+            elif batched_content is not None:
+                print("      Using batch-written section...")
+                section_content = batched_content
+                sections_written += 1
+            else:
+                # FALLBACK: Write from scratch using general research
+                print(f"      No research file - writing from general research...")
+                if research_json is None:
+                    # Compact separators: indentation is wasted tokens for LLM input
+                    research_json = json.dumps(research, separators=(",", ":"))[:3000]  # Limit research to 3k chars
+                section_content = write_single_section(
+                    section_def=section_def,
+                    research_json=research_json,
+                    company_name=company_name,
+                    investment_type=investment_type,
+                    memo_mode=memo_mode,
+                    style_guide=style_guide,
+                    model=model,
+                    current_date=current_date,
+                    stream_path=stream_path
+                )
+                sections_written += 1
+
+            # Save individual section
+            save_section_artifact(output_dir, section_num, section_name, section_content,
+                                  sections_dir=sections_dir)
+        finally:
+            # Also on failure: don't leave a stale .partial in 2-sections/
+            stream_path.unlink(missing_ok=True)
+
+        word_count = _approx_word_count(section_content)
         total_words += word_count
 
-        print(f"      ✓ Saved ({word_count} words)\n")
+        print(f"      ✓ Saved (~{word_count} words)\n")
 
     # Sections saved - enrichment agents will process files directly
     print(f"✅ All {len(outline.sections)} sections complete using outline: {outline.metadata.outline_type}")
-    print(f"   Total words: {total_words}")
+    print(f"   Total words: ~{total_words}")
     if sections_polished > 0:
         print(f"   Polished from research: {sections_polished} sections")
     if sections_written > 0:
         print(f"   Written from scratch: {sections_written} sections")
-    print(f"   Saved to: {output_dir}/2-sections/")
+    print(f"   Saved to: {sections_dir}/")
     print(f"   Enrichment agents will process sections individually\n")
 
     # Return minimal state (enrichment agents load from files)
     return {
         "draft_sections": {},  # Enrichment agents load from files, not state
-        "messages": [f"Draft sections completed for {company_name} ({total_words} words total, {sections_polished} polished, {sections_written} written) using outline: {outline.metadata.outline_type}"]
+        "messages": [f"Draft sections completed for {company_name} (~{total_words} words total, {sections_polished} polished, {sections_written} written) using outline: {outline.metadata.outline_type}"]
     }
@@ -5,15 +5,65 @@ This module provides functions to save structured and human-readable artifacts
 at each stage of the workflow, enabling transparency and targeted improvements.
 """
 
+import gzip
 import json
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+
+def dump_json_bytes(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize an artifact to pretty-printed UTF-8 JSON.
+
+    Uses orjson when installed (much faster on large research/state blobs),
+    falling back to the stdlib encoder with the same 2-space indent.
+
+    Args:
+        obj: Object to serialize
+        default: Optional fallback for non-serializable values (e.g. str)
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    return json.dumps(obj, indent=2, default=default, ensure_ascii=False).encode("utf-8")
+
+
+def _pretty(obj: Any) -> str:
+    """Pretty-print a nested value for a ```json fence in a markdown report."""
+    return dump_json_bytes(obj).decode("utf-8")
+
+
+# sanitize_filename keeps alphanumerics, space, '-' and '_'. ASCII names (the
+# common case) go through a precomputed delete table; \w mirrors str.isalnum()
+# plus '_' for non-ASCII names.
+_FILENAME_ASCII_DELETE = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) in " -_"))
+)
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w \-]+")
+
+
+@lru_cache(maxsize=512)
 def sanitize_filename(name: str) -> str:
     """
-    Convert company name to safe filename.
+    Convert company name to safe filename (memoized - called on every save path).
 
     Args:
         name: Company name to sanitize
@@ -21,7 +71,10 @@ def sanitize_filename(name: str) -> str:
     Returns:
         Safe filename string
     """
-    safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+    if name.isascii():
+        safe_name = name.translate(_FILENAME_ASCII_DELETE).strip()
+    else:
+        safe_name = _FILENAME_UNSAFE_RE.sub("", name).strip()
     return safe_name.replace(' ', '-')
 
 
@@ -66,6 +119,124 @@ def create_artifact_directory(
     return output_dir
 
 
+# Shared pool for overlapping independent artifact writes; threads start lazily.
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="artifacts-io")
+
+
+def _save_json_and_markdown(
+    output_dir: Path,
+    stem: str,
+    data: Dict[str, Any],
+    render: Callable[[Dict[str, Any]], Iterable[str]],
+) -> None:
+    """
+    Write {stem}.json and {stem}.md side by side.
+
+    The JSON write runs on the I/O pool while the markdown chunks from render()
+    are streamed into a 1 MiB buffered file on the calling thread, so the full
+    report never has to exist as one string and slow filesystems pay one write
+    latency instead of two.
+    """
+    json_write = _IO_POOL.submit((output_dir / f"{stem}.json").write_bytes, dump_json_bytes(data))
+    with open(output_dir / f"{stem}.md", "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(render(data))
+    json_write.result()
+
+
+class ArtifactBatch:
+    """
+    Queue of artifact files written together.
+
+    For steps that produce several files at once: add() queues encoded bytes,
+    flush() writes them concurrently on the I/O pool with a single open/write/
+    close per file.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Path, bytes] = {}
+
+    def add(self, path: Path, data: bytes) -> None:
+        """Queue data for path (a later add for the same path replaces it)."""
+        self._pending[path] = data
+
+    def flush(self) -> None:
+        """Write all queued files."""
+        pending, self._pending = self._pending, {}
+        list(_IO_POOL.map(self._write, pending.items()))
+
+    @staticmethod
+    def _write(item) -> None:
+        path, data = item
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+_DECK_DRAFT_PREFIX = b"<!-- DRAFT FROM DECK ANALYSIS - Cite as [Company Pitch Deck] -->\n\n"
+
+# Firm-scoped deal contexts, keyed by (company_name, firm). Legacy fallbacks are
+# not cached so a deal directory created later in the process is still picked up.
+_CTX_CACHE: Dict[tuple, Any] = {}
+
+# VersionManager instances keyed by (base output dir, firm), stored together with
+# the versions.json mtime they were loaded at.
+_VM_CACHE: Dict[tuple, tuple] = {}
+
+
+def _resolve_ctx(company_name: str, firm: Optional[str]):
+    """Memoized resolve_deal_context for firm-scoped deals."""
+    from .paths import resolve_deal_context
+
+    key = (company_name, firm)
+    ctx = _CTX_CACHE.get(key)
+    if ctx is None:
+        ctx = resolve_deal_context(company_name, firm=firm)
+        if not ctx.is_legacy:
+            _CTX_CACHE[key] = ctx
+    return ctx
+
+
+def _versions_mtime(version_mgr) -> Optional[int]:
+    try:
+        return version_mgr.versions_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _get_version_manager(company_name: str, firm: Optional[str] = None):
+    """
+    Return a VersionManager for the company's output scope, reusing a cached
+    instance until versions.json changes on disk.
+    """
+    from .versioning import VersionManager
+
+    if firm:
+        ctx = _resolve_ctx(company_name, firm)
+        base_dir = ctx.outputs_dir.parent if ctx.outputs_dir else Path("output")
+    else:
+        base_dir = Path("output")
+
+    key = (base_dir, firm)
+    cached = _VM_CACHE.get(key)
+    if cached is not None and cached[0] == _versions_mtime(cached[1]):
+        return cached[1]
+
+    version_mgr = VersionManager(base_dir, firm=firm)
+    _VM_CACHE[key] = (_versions_mtime(version_mgr), version_mgr)
+    return version_mgr
+
+
+def _invalidate_version_manager(version_mgr) -> None:
+    """Drop a VersionManager from the cache (e.g. after allocating a new version)."""
+    for key, (_, cached) in list(_VM_CACHE.items()):
+        if cached is version_mgr:
+            del _VM_CACHE[key]
+
+
 def save_deck_analysis_artifacts(
     company_name: str,
     deck_analysis: Dict[str, Any],
@@ -92,32 +263,27 @@ def save_deck_analysis_artifacts(
         output_dir.mkdir(parents=True, exist_ok=True)
     else:
         # Legacy fallback: create a new version directory
-        from .versioning import VersionManager
-        from .paths import resolve_deal_context
-
         print(f"  [DEBUG] Starting save_deck_analysis_artifacts for {company_name} (firm={firm})", flush=True)
 
-        if firm:
-            ctx = resolve_deal_context(company_name, firm=firm)
-            version_mgr = VersionManager(ctx.outputs_dir.parent if ctx.outputs_dir else Path("output"), firm=firm)
-        else:
-            version_mgr = VersionManager(Path("output"))
+        version_mgr = _get_version_manager(company_name, firm)
 
         safe_name = sanitize_filename(company_name)
         version = version_mgr.get_next_version(safe_name)
+        # A new version directory is about to exist - don't serve this manager again
+        _invalidate_version_manager(version_mgr)
         output_dir = create_artifact_directory(company_name, version, firm=firm)
         print(f"  [DEBUG] Created artifact directory: {output_dir}", flush=True)
 
+    # Every deck artifact is independent - queue them and write in one batch
+    batch = ArtifactBatch()
+
     # Save structured JSON
     print(f"  [DEBUG] Saving 0-deck-analysis.json...", flush=True)
-    with open(output_dir / "0-deck-analysis.json", "w") as f:
-        json.dump(deck_analysis, f, indent=2, ensure_ascii=False)
+    batch.add(output_dir / "0-deck-analysis.json", dump_json_bytes(deck_analysis))
 
     # Save human-readable summary
     print(f"  [DEBUG] Saving 0-deck-analysis.md...", flush=True)
-    summary = format_deck_analysis_summary(deck_analysis)
-    with open(output_dir / "0-deck-analysis.md", "w") as f:
-        f.write(summary)
+    batch.add(output_dir / "0-deck-analysis.md", format_deck_analysis_summary(deck_analysis).encode("utf-8"))
 
     # Save initial section drafts to 0-deck-sections/ (separate from final 2-sections/)
     # These will be fed to Perplexity researcher as citable input
@@ -126,8 +292,9 @@ def save_deck_analysis_artifacts(
     deck_sections_dir.mkdir(exist_ok=True)
 
     for filename, content in section_drafts.items():
-        with open(deck_sections_dir / filename, "w") as f:
-            f.write(f"<!-- DRAFT FROM DECK ANALYSIS - Cite as [Company Pitch Deck] -->\n\n{content}")
+        batch.add(deck_sections_dir / filename, _DECK_DRAFT_PREFIX + content.encode("utf-8"))
+
+    batch.flush()
 
     print(f"Deck analysis artifacts saved: {len(section_drafts)} initial sections created to 0-deck-sections/", flush=True)
 
@@ -145,17 +312,10 @@ def load_existing_section_drafts(company_name: str, firm: str = None) -> Dict[st
     Returns:
         Dictionary mapping section filenames to content
     """
-    from .versioning import VersionManager
-    from .paths import resolve_deal_context
-
     safe_name = sanitize_filename(company_name)
 
     # Get version manager - firm-aware
-    if firm:
-        ctx = resolve_deal_context(company_name, firm=firm)
-        version_mgr = VersionManager(ctx.outputs_dir.parent if ctx.outputs_dir else Path("output"), firm=firm)
-    else:
-        version_mgr = VersionManager(Path("output"))
+    version_mgr = _get_version_manager(company_name, firm)
 
     # Get the latest version for this company
     if safe_name not in version_mgr.versions_data:
@@ -165,21 +325,41 @@ def load_existing_section_drafts(company_name: str, firm: str = None) -> Dict[st
 
     # Get output directory - firm-aware
     if firm:
-        output_dir = ctx.get_version_output_dir(latest_version)
+        output_dir = _resolve_ctx(company_name, firm).get_version_output_dir(latest_version)
     else:
         output_dir = Path("output") / f"{safe_name}-{latest_version}"
 
     sections_dir = output_dir / "2-sections"
 
-    if not sections_dir.exists():
+    # scandir reports file type from the directory entry, avoiding a stat per file
+    try:
+        with os.scandir(sections_dir) as it:
+            entries = [e for e in it if e.name.endswith(".md") and e.is_file()]
+    except FileNotFoundError:
         return {}
 
-    drafts = {}
-    for section_file in sections_dir.glob("*.md"):
-        with open(section_file) as f:
-            drafts[section_file.name] = f.read()
+    return {e.name: Path(e.path).read_text() for e in entries}
+
+
+# 'Generated' timestamp of the memo run executing in the current context. Every
+# run entry point calls reset_run_timestamp(); a ContextVar keeps server jobs,
+# each on its own worker thread, from sharing a stale or foreign value.
+_RUN_TIMESTAMP: ContextVar[Optional[str]] = ContextVar("run_timestamp", default=None)
+
+
+def _run_timestamp() -> str:
+    """'Generated' timestamp shared by every report of the current memo run."""
+    return _RUN_TIMESTAMP.get() or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-    return drafts
+
+def reset_run_timestamp() -> None:
+    """Start a new memo run; reports written in this context share a fresh timestamp."""
+    _RUN_TIMESTAMP.set(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+
+
+def _report_header(title: str) -> str:
+    """Title line plus generation timestamp shared by every markdown report."""
+    return f"# {title}\n\n**Generated**: {_run_timestamp()}\n\n"
 
 
 def format_deck_analysis_summary(deck_analysis: Dict[str, Any]) -> str:
@@ -192,81 +372,89 @@ def format_deck_analysis_summary(deck_analysis: Dict[str, Any]) -> str:
     Returns:
         Markdown formatted summary
     """
-    md = "# Deck Analysis Summary\n\n"
-    md += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    md += f"**Company**: {deck_analysis.get('company_name', 'N/A')}\n\n"
-    md += f"**Pages**: {deck_analysis.get('deck_page_count', 'N/A')}\n\n"
-    md += "---\n\n"
-
-    md += "## Key Information Extracted\n\n"
+    # Look up each optional field once; reused for both the truth test and the body
+    get = deck_analysis.get
+    market = get('market_size')
+    traction = get('traction_metrics')
+    team = get('team_members')
+    funds = get('use_of_funds')
+    gtm = get('go_to_market')
+    comp = get('competitive_landscape')
+    notes = get('extraction_notes')
+    screenshots_list = get('screenshots')
+
+    parts = [_report_header("Deck Analysis Summary")]
+    append = parts.append
+    append(f"**Company**: {get('company_name', 'N/A')}\n\n")
+    append(f"**Pages**: {get('deck_page_count', 'N/A')}\n\n")
+    append("---\n\n")
+
+    append("## Key Information Extracted\n\n")
 
     # Business
-    md += "### Business\n\n"
-    md += f"- **Tagline**: {deck_analysis.get('tagline', 'Not mentioned')}\n"
-    md += f"- **Problem**: {deck_analysis.get('problem_statement', 'Not mentioned')}\n"
-    md += f"- **Solution**: {deck_analysis.get('solution_description', 'Not mentioned')}\n"
-    md += f"- **Business Model**: {deck_analysis.get('business_model', 'Not mentioned')}\n\n"
+    append("### Business\n\n")
+    append(f"- **Tagline**: {get('tagline', 'Not mentioned')}\n")
+    append(f"- **Problem**: {get('problem_statement', 'Not mentioned')}\n")
+    append(f"- **Solution**: {get('solution_description', 'Not mentioned')}\n")
+    append(f"- **Business Model**: {get('business_model', 'Not mentioned')}\n\n")
 
     # Market
-    if deck_analysis.get('market_size'):
-        md += "### Market\n\n"
-        md += f"```json\n{json.dumps(deck_analysis.get('market_size', {}), indent=2)}\n```\n\n"
+    if market:
+        append("### Market\n\n")
+        append(f"```json\n{_pretty(market)}\n```\n\n")
 
     # Traction
-    if deck_analysis.get('traction_metrics'):
-        md += "### Traction\n\n"
-        md += f"```json\n{json.dumps(deck_analysis.get('traction_metrics', []), indent=2)}\n```\n\n"
+    if traction:
+        append("### Traction\n\n")
+        append(f"```json\n{_pretty(traction)}\n```\n\n")
 
     # Team
-    if deck_analysis.get('team_members'):
-        md += "### Team\n\n"
-        md += f"```json\n{json.dumps(deck_analysis.get('team_members', []), indent=2)}\n```\n\n"
+    if team:
+        append("### Team\n\n")
+        append(f"```json\n{_pretty(team)}\n```\n\n")
 
     # Funding
-    md += "### Funding\n\n"
-    md += f"- **Ask**: {deck_analysis.get('funding_ask', 'Not mentioned')}\n"
-    if deck_analysis.get('use_of_funds'):
-        md += f"- **Use of Funds**: {json.dumps(deck_analysis.get('use_of_funds', []))}\n"
-    md += "\n"
+    append("### Funding\n\n")
+    append(f"- **Ask**: {get('funding_ask', 'Not mentioned')}\n")
+    if funds:
+        append(f"- **Use of Funds**: {json.dumps(funds)}\n")
+    append("\n")
 
     # Go-to-Market & Competition
-    if deck_analysis.get('go_to_market') and deck_analysis.get('go_to_market') != 'Not mentioned':
-        md += "### Go-to-Market\n\n"
-        md += f"{deck_analysis.get('go_to_market')}\n\n"
+    if gtm and gtm != 'Not mentioned':
+        append("### Go-to-Market\n\n")
+        append(f"{gtm}\n\n")
 
-    if deck_analysis.get('competitive_landscape') and deck_analysis.get('competitive_landscape') != 'Not mentioned':
-        md += "### Competitive Landscape\n\n"
-        md += f"{deck_analysis.get('competitive_landscape')}\n\n"
+    if comp and comp != 'Not mentioned':
+        append("### Competitive Landscape\n\n")
+        append(f"{comp}\n\n")
 
     # Extraction notes
-    if deck_analysis.get('extraction_notes'):
-        md += "## Extraction Notes\n\n"
-        for note in deck_analysis.get('extraction_notes', []):
-            md += f"- {note}\n"
-        md += "\n"
+    if notes:
+        append("## Extraction Notes\n\n")
+        for note in notes:
+            append(f"- {note}\n")
+        append("\n")
 
     # Screenshots
-    if deck_analysis.get('screenshots'):
-        md += "## Extracted Screenshots\n\n"
-        md += f"**Total**: {len(deck_analysis['screenshots'])} visual pages captured\n\n"
+    if screenshots_list:
+        append("## Extracted Screenshots\n\n")
+        append(f"**Total**: {len(screenshots_list)} visual pages captured\n\n")
 
         # Group by category
-        screenshots_by_category = {}
-        for screenshot in deck_analysis['screenshots']:
-            category = screenshot.get('category', 'general')
-            if category not in screenshots_by_category:
-                screenshots_by_category[category] = []
-            screenshots_by_category[category].append(screenshot)
+        screenshots_by_category = defaultdict(list)
+        for screenshot in screenshots_list:
+            screenshots_by_category[screenshot.get('category', 'general')].append(screenshot)
 
         for category, screenshots in screenshots_by_category.items():
-            md += f"### {category.title()}\n\n"
+            append(f"### {category.title()}\n\n")
             for ss in screenshots:
-                md += f"- **Page {ss['page_number']}**: {ss.get('description', 'No description')}\n"
-                md += f"  - File: `{ss['path']}`\n"
-                md += f"  - Dimensions: {ss.get('width', '?')}x{ss.get('height', '?')}px\n"
-            md += "\n"
+                append(f"- **Page {ss['page_number']}**: {ss.get('description', 'No description')}\n")
+                append(f"  - File: `{ss['path']}`\n")
+                append(f"  - Dimensions: {ss.get('width', '?')}x{ss.get('height', '?')}px\n")
+            append("\n")
 
-    return md
+    return "".join(parts)
 
 
 def save_research_artifacts(output_dir: Path, research_data: Dict[str, Any]) -> None:
@@ -277,144 +465,148 @@ def save_research_artifacts(output_dir: Path, research_data: Dict[str, Any]) ->
         output_dir: Directory to save artifacts
         research_data: Research data from research agent
     """
-    # Save structured JSON
-    with open(output_dir / "1-research.json", "w") as f:
-        json.dump(research_data, f, indent=2, ensure_ascii=False)
+    # Structured JSON + human-readable markdown summary
+    _save_json_and_markdown(output_dir, "1-research", research_data, iter_research_summary)
 
-    # Save human-readable markdown summary
-    summary = format_research_summary(research_data)
-    with open(output_dir / "1-research.md", "w") as f:
-        f.write(summary)
 
+def _iter_sources(sources: List[Any]) -> Iterator[str]:
+    """Yield a **Sources** bullet list; dict sources render as markdown links."""
+    yield "**Sources**:\n"
+    for source in sources:
+        if isinstance(source, dict):
+            yield f"- [{source.get('title', 'Source')}]({source.get('url', '#')})\n"
+        else:
+            yield f"- {source}\n"
+    yield "\n"
 
-def format_research_summary(research_data: Dict[str, Any]) -> str:
+
+def iter_research_summary(research_data: Dict[str, Any]) -> Iterator[str]:
     """
-    Format research data as human-readable markdown.
+    Render research data as human-readable markdown, yielded in chunks.
 
     Args:
         research_data: Research data from research agent
 
     Returns:
-        Markdown formatted summary
+        Chunks of the markdown formatted summary
     """
-    md = "# Research Summary\n\n"
-    md += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-    md += "---\n\n"
+    yield _report_header("Research Summary")
+    yield "---\n\n"
 
     # Company overview
     if "company_overview" in research_data:
-        md += "## Company Overview\n\n"
+        yield "## Company Overview\n\n"
         overview = research_data["company_overview"]
         for key, value in overview.items():
             if key != "sources":
-                md += f"**{key.replace('_', ' ').title()}**: {value}\n\n"
+                yield f"**{key.replace('_', ' ').title()}**: {value}\n\n"
 
-        if "sources" in overview and overview["sources"]:
-            md += "**Sources**:\n"
-            for source in overview["sources"]:
-                if isinstance(source, dict):
-                    md += f"- [{source.get('title', 'Source')}]({source.get('url', '#')})\n"
-                else:
-                    md += f"- {source}\n"
-            md += "\n"
+        if sources := overview.get("sources"):
+            yield from _iter_sources(sources)
 
     # Funding
     if "funding" in research_data:
-        md += "## Funding & Investors\n\n"
+        yield "## Funding & Investors\n\n"
         funding = research_data["funding"]
         for key, value in funding.items():
             if key != "sources" and not isinstance(value, list):
-                md += f"**{key.replace('_', ' ').title()}**: {value}\n\n"
-
-        if "rounds" in funding and isinstance(funding["rounds"], list):
-            md += "**Funding Rounds**:\n"
-            for round_info in funding["rounds"]:
-                md += f"- {round_info}\n"
-            md += "\n"
-
-        if "investors" in funding and isinstance(funding["investors"], list):
-            md += "**Investors**:\n"
-            for investor in funding["investors"]:
-                md += f"- {investor}\n"
-            md += "\n"
-
-        if "sources" in funding and funding["sources"]:
-            md += "**Sources**:\n"
-            for source in funding["sources"]:
-                if isinstance(source, dict):
-                    md += f"- [{source.get('title', 'Source')}]({source.get('url', '#')})\n"
-                else:
-                    md += f"- {source}\n"
-            md += "\n"
+                yield f"**{key.replace('_', ' ').title()}**: {value}\n\n"
+
+        if isinstance(rounds := funding.get("rounds"), list):
+            yield "**Funding Rounds**:\n"
+            yield from (f"- {round_info}\n" for round_info in rounds)
+            yield "\n"
+
+        if isinstance(investors := funding.get("investors"), list):
+            yield "**Investors**:\n"
+            yield from (f"- {investor}\n" for investor in investors)
+            yield "\n"
+
+        if sources := funding.get("sources"):
+            yield from _iter_sources(sources)
 
     # Team
     if "team" in research_data:
-        md += "## Team\n\n"
+        yield "## Team\n\n"
         team = research_data["team"]
 
-        if "founders" in team and isinstance(team["founders"], list):
-            md += "**Founders**:\n"
-            for founder in team["founders"]:
+        if isinstance(founders := team.get("founders"), list):
+            yield "**Founders**:\n"
+            for founder in founders:
                 if isinstance(founder, dict):
                     name = founder.get("name", "Unknown")
                     title = founder.get("title", "")
                     background = founder.get("background", "")
                     linkedin = founder.get("linkedin_url", "")
 
-                    md += f"- **{name}**"
+                    yield f"- **{name}**"
                     if linkedin:
-                        md += f" ([LinkedIn]({linkedin}))"
+                        yield f" ([LinkedIn]({linkedin}))"
                     if title:
-                        md += f" - {title}"
-                    md += "\n"
+                        yield f" - {title}"
+                    yield "\n"
                     if background:
-                        md += f"  - {background}\n"
-                else:
-                    md += f"- {founder}\n"
-            md += "\n"
-
-        if "sources" in team and team["sources"]:
-            md += "**Sources**:\n"
-            for source in team["sources"]:
-                if isinstance(source, dict):
-                    md += f"- [{source.get('title', 'Source')}]({source.get('url', '#')})\n"
+                        yield f"  - {background}\n"
                 else:
-                    md += f"- {source}\n"
-            md += "\n"
+                    yield f"- {founder}\n"
+            yield "\n"
+
+        if sources := team.get("sources"):
+            yield from _iter_sources(sources)
 
     # Recent news
     if "recent_news" in research_data:
-        md += "## Recent News & Developments\n\n"
+        yield "## Recent News & Developments\n\n"
         news = research_data["recent_news"]
 
-        if "highlights" in news and isinstance(news["highlights"], list):
-            for highlight in news["highlights"]:
-                md += f"- {highlight}\n"
-            md += "\n"
+        if isinstance(highlights := news.get("highlights"), list):
+            yield from (f"- {highlight}\n" for highlight in highlights)
+            yield "\n"
 
-        if "sources" in news and news["sources"]:
-            md += "**Sources**:\n"
-            for source in news["sources"]:
-                if isinstance(source, dict):
-                    md += f"- [{source.get('title', 'Source')}]({source.get('url', '#')})\n"
-                else:
-                    md += f"- {source}\n"
-            md += "\n"
+        if sources := news.get("sources"):
+            yield from _iter_sources(sources)
 
     # Web search metadata
     if "web_search_metadata" in research_data:
-        md += "---\n\n"
-        md += "## Search Metadata\n\n"
         metadata = research_data["web_search_metadata"]
-        md += f"**Provider**: {metadata.get('provider', 'Unknown')}\n\n"
-        md += f"**Queries Executed**: {metadata.get('queries_count', 0)}\n\n"
-        md += f"**Total Results**: {metadata.get('total_results', 0)}\n\n"
+        yield (
+            "---\n\n## Search Metadata\n\n"
+            f"**Provider**: {metadata.get('provider', 'Unknown')}\n\n"
+            f"**Queries Executed**: {metadata.get('queries_count', 0)}\n\n"
+            f"**Total Results**: {metadata.get('total_results', 0)}\n\n"
+        )
+
+
+def format_research_summary(research_data: Dict[str, Any]) -> str:
+    """
+    Format research data as human-readable markdown.
+
+    Args:
+        research_data: Research data from research agent
+
+    Returns:
+        Markdown formatted summary
+    """
+    return "".join(iter_research_summary(research_data))
+
 
-    return md
+@lru_cache(maxsize=64)
+def build_section_filename(section_number: int, section_name: str) -> str:
+    """
+    Filename for a section artifact, e.g. "03-market-opportunity.md".
+
+    Memoized - the outline's section list repeats across saves and runs.
+    """
+    return f"{section_number:02d}-{sanitize_filename(section_name).lower()}.md"
+
+
+_LEADING_HEADING_RE = re.compile(r'^(#{1,3})\s*(?:\d+\.\s*)?(.+?)\s*\n')
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
 
 
 def save_section_artifact(output_dir: Path, section_number: int,
-                          section_name: str, content: str) -> None:
+                          section_name: str, content: str,
+                          sections_dir: Optional[Path] = None) -> None:
     """
     Save individual section to artifacts.
 
@@ -423,11 +615,11 @@ def save_section_artifact(output_dir: Path, section_number: int,
         section_number: Section number (1-10)
         section_name: Name of the section
         content: Section content
+        sections_dir: Optional precomputed output_dir / "2-sections" (for callers saving many sections)
     """
-    import re
-
-    sections_dir = output_dir / "2-sections"
-    filename = f"{section_number:02d}-{sanitize_filename(section_name).lower()}.md"
+    if sections_dir is None:
+        sections_dir = output_dir / "2-sections"
+    filename = build_section_filename(section_number, section_name)
 
     # Deduplicate leading heading from LLM output. The LLM sometimes includes
     # a section header despite being told not to. We add the canonical
@@ -435,7 +627,7 @@ def save_section_artifact(output_dir: Path, section_number: int,
     # that's redundant (same words as the section name), strip it.
     # If the LLM heading adds different words, leave it as a subsection.
     content = content.strip()
-    leading_heading = re.match(r'^(#{1,3})\s*(?:\d+\.\s*)?(.+?)\s*\n', content)
+    leading_heading = _LEADING_HEADING_RE.match(content)
     if leading_heading:
         llm_heading_text = leading_heading.group(2).strip().lower()
         canonical_text = section_name.strip().lower()
@@ -457,11 +649,12 @@ def save_section_artifact(output_dir: Path, section_number: int,
             return f"### {rest}"  # # or ## → ###
         return match.group(0)    # ### and below stay as-is
 
-    content = re.sub(r'^(#{1,6})\s+(.+)$', demote_heading, content, flags=re.MULTILINE)
+    content = _HEADING_RE.sub(demote_heading, content)
 
-    with open(sections_dir / filename, "w") as f:
-        f.write(f"## {section_number}. {section_name}\n\n")
-        f.write(content)
+    # Header and body in one write
+    (sections_dir / filename).write_bytes(
+        f"## {section_number}. {section_name}\n\n{content}".encode("utf-8")
+    )
 
 
 def save_validation_artifacts(output_dir: Path, validation_data: Dict[str, Any]) -> None:
@@ -472,32 +665,25 @@ def save_validation_artifacts(output_dir: Path, validation_data: Dict[str, Any])
         output_dir: Directory to save artifacts
         validation_data: Validation data from validator agent
     """
-    # Save structured JSON
-    with open(output_dir / "3-validation.json", "w") as f:
-        json.dump(validation_data, f, indent=2, ensure_ascii=False)
-
-    # Save human-readable markdown report
-    report = format_validation_report(validation_data)
-    with open(output_dir / "3-validation.md", "w") as f:
-        f.write(report)
+    # Structured JSON + human-readable markdown report
+    _save_json_and_markdown(output_dir, "3-validation", validation_data, iter_validation_report)
 
 
-def format_validation_report(validation_data: Dict[str, Any]) -> str:
+def iter_validation_report(validation_data: Dict[str, Any]) -> Iterator[str]:
     """
-    Format validation data as human-readable markdown report.
+    Render validation data as human-readable markdown report, yielded in chunks.
 
     Args:
         validation_data: Validation data from validator agent
 
     Returns:
-        Markdown formatted report
+        Chunks of the markdown formatted report
     """
-    md = "# Validation Report\n\n"
-    md += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    yield _report_header("Validation Report")
 
     # Overall score
     overall_score = validation_data.get("overall_score", 0.0)
-    md += f"## Overall Score: {overall_score}/10\n\n"
+    yield f"## Overall Score: {overall_score}/10\n\n"
 
     # Determine status
     if overall_score >= 8.0:
@@ -510,44 +696,50 @@ def format_validation_report(validation_data: Dict[str, Any]) -> str:
         status = "❌ **SIGNIFICANT ISSUES** - Major revision required"
         color = "red"
 
-    md += f"{status}\n\n"
-    md += "---\n\n"
+    yield f"{status}\n\n---\n\n"
 
     # Section-by-section feedback
     if "section_scores" in validation_data:
-        md += "## Section Scores\n\n"
+        yield "## Section Scores\n\n"
         for section_name, section_data in validation_data.get("section_scores", {}).items():
             score = section_data.get("score", 0.0)
-            md += f"### {section_name}: {score}/10\n\n"
+            yield f"### {section_name}: {score}/10\n\n"
 
-            if "issues" in section_data and section_data["issues"]:
-                md += "**Issues**:\n"
-                for issue in section_data["issues"]:
-                    md += f"- {issue}\n"
-                md += "\n"
+            if issues := section_data.get("issues"):
+                yield "**Issues**:\n"
+                yield from (f"- {issue}\n" for issue in issues)
+                yield "\n"
 
-            if "suggestions" in section_data and section_data["suggestions"]:
-                md += "**Suggestions**:\n"
-                for suggestion in section_data["suggestions"]:
-                    md += f"- {suggestion}\n"
-                md += "\n"
+            if suggestions := section_data.get("suggestions"):
+                yield "**Suggestions**:\n"
+                yield from (f"- {suggestion}\n" for suggestion in suggestions)
+                yield "\n"
 
     # Overall issues and suggestions
     full_memo_validation = validation_data.get("full_memo", {})
 
-    if "issues" in full_memo_validation and full_memo_validation["issues"]:
-        md += "## Overall Issues\n\n"
-        for issue in full_memo_validation["issues"]:
-            md += f"- {issue}\n"
-        md += "\n"
+    if issues := full_memo_validation.get("issues"):
+        yield "## Overall Issues\n\n"
+        yield from (f"- {issue}\n" for issue in issues)
+        yield "\n"
+
+    if suggestions := full_memo_validation.get("suggestions"):
+        yield "## Overall Suggestions\n\n"
+        yield from (f"- {suggestion}\n" for suggestion in suggestions)
+        yield "\n"
+
+
+def format_validation_report(validation_data: Dict[str, Any]) -> str:
+    """
+    Format validation data as human-readable markdown report.
 
-    if "suggestions" in full_memo_validation and full_memo_validation["suggestions"]:
-        md += "## Overall Suggestions\n\n"
-        for suggestion in full_memo_validation["suggestions"]:
-            md += f"- {suggestion}\n"
-        md += "\n"
+    Args:
+        validation_data: Validation data from validator agent
 
-    return md
+    Returns:
+        Markdown formatted report
+    """
+    return "".join(iter_validation_report(validation_data))
 
 
 def save_fact_check_artifacts(output_dir: Path, fact_check_data: Dict[str, Any]) -> None:
@@ -558,14 +750,33 @@ def save_fact_check_artifacts(output_dir: Path, fact_check_data: Dict[str, Any])
         output_dir: Directory to save artifacts
         fact_check_data: Fact-check data from fact_checker agent
     """
-    # Save structured JSON
-    with open(output_dir / "4-fact-check.json", "w") as f:
-        json.dump(fact_check_data, f, indent=2, ensure_ascii=False)
+    # Structured JSON + human-readable markdown report
+    _save_json_and_markdown(
+        output_dir, "4-fact-check", fact_check_data, lambda data: (format_fact_check_report(data),)
+    )
+
+
+def _render_fact_check_section(parts: List[str], section_data: Dict[str, Any]) -> None:
+    """Append one section's fact-check result block to the report."""
+    get = section_data.get
+    requires_rewrite = get("requires_rewrite", False)
+
+    # Fixed-shape header rendered as a single fragment
+    parts.append(
+        f"### {'❌' if requires_rewrite else '✅'} {get('section', 'Unknown')}\n\n"
+        f"- **Score**: {get('score', 0.0):.0%}\n"
+        f"- **Claims**: {get('verified_claims', 0)}/{get('total_claims', 0)} verified\n"
+    )
 
-    # Save human-readable markdown report
-    report = format_fact_check_report(fact_check_data)
-    with open(output_dir / "4-fact-check.md", "w") as f:
-        f.write(report)
+    if requires_rewrite:
+        parts.append("- **Status**: ⚠️ Requires review\n")
+
+        critical_issues = get("critical_issues", [])
+        if critical_issues:
+            parts.append(f"\n**Critical Issues** ({len(critical_issues)}):\n")
+            parts.extend(f"- {issue[:150]}...\n" for issue in critical_issues[:5])  # Show first 5
+
+    parts.append("\n")
 
 
 def format_fact_check_report(fact_check_data: Dict[str, Any]) -> str:
@@ -578,8 +789,8 @@ def format_fact_check_report(fact_check_data: Dict[str, Any]) -> str:
     Returns:
         Markdown formatted report
     """
-    md = "# Fact-Check Report\n\n"
-    md += f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+    parts = [_report_header("Fact-Check Report")]
+    append = parts.append
 
     summary = fact_check_data.get("summary", {})
     overall_score = summary.get("overall_score", 0.0)
@@ -588,11 +799,11 @@ def format_fact_check_report(fact_check_data: Dict[str, Any]) -> str:
     sections_flagged = summary.get("sections_flagged", 0)
     strictness = summary.get("strictness", "high")
 
-    md += f"## Overall Score: {overall_score:.0%}\n\n"
-    md += f"**Strictness**: {strictness.upper()}\n"
-    md += f"**Total Claims**: {total_claims}\n"
-    md += f"**Verified (with citations)**: {verified_claims}\n"
-    md += f"**Sections Flagged**: {sections_flagged}\n\n"
+    append(f"## Overall Score: {overall_score:.0%}\n\n")
+    append(f"**Strictness**: {strictness.upper()}\n")
+    append(f"**Total Claims**: {total_claims}\n")
+    append(f"**Verified (with citations)**: {verified_claims}\n")
+    append(f"**Sections Flagged**: {sections_flagged}\n\n")
 
     # Determine status
     if fact_check_data.get("overall_pass", False):
@@ -600,46 +811,26 @@ def format_fact_check_report(fact_check_data: Dict[str, Any]) -> str:
     else:
         status = f"⚠️ **REVIEW REQUIRED** - {sections_flagged} sections need attention"
 
-    md += f"{status}\n\n"
-    md += "---\n\n"
+    append(f"{status}\n\n")
+    append("---\n\n")
 
     # Section-by-section results
     if "fact_check_results" in fact_check_data:
-        md += "## Section Results\n\n"
+        append("## Section Results\n\n")
         for section_data in fact_check_data.get("fact_check_results", []):
-            section_name = section_data.get("section", "Unknown")
-            total = section_data.get("total_claims", 0)
-            verified = section_data.get("verified_claims", 0)
-            score = section_data.get("score", 0.0)
-            requires_rewrite = section_data.get("requires_rewrite", False)
-
-            status_icon = "❌" if requires_rewrite else "✅"
-            md += f"### {status_icon} {section_name}\n\n"
-            md += f"- **Score**: {score:.0%}\n"
-            md += f"- **Claims**: {verified}/{total} verified\n"
-
-            if requires_rewrite:
-                md += f"- **Status**: ⚠️ Requires review\n"
-
-                critical_issues = section_data.get("critical_issues", [])
-                if critical_issues:
-                    md += f"\n**Critical Issues** ({len(critical_issues)}):\n"
-                    for issue in critical_issues[:5]:  # Show first 5
-                        md += f"- {issue[:150]}...\n"
-
-            md += "\n"
+            _render_fact_check_section(parts, section_data)
 
     # Sections to rewrite
     sections_to_rewrite = fact_check_data.get("sections_to_rewrite", [])
     if sections_to_rewrite:
-        md += "## Sections Requiring Revision\n\n"
+        append("## Sections Requiring Revision\n\n")
         for section in sections_to_rewrite:
             section_display = section.replace('-', ' ').title()
-            md += f"- {section_display}\n"
-        md += "\n"
-        md += "**Recommendation**: Use `improve-section.py` to add citations or remove unsourced claims.\n\n"
+            append(f"- {section_display}\n")
+        append("\n")
+        append("**Recommendation**: Use `improve-section.py` to add citations or remove unsourced claims.\n\n")
 
-    return md
+    return "".join(parts)
 
 
 # =============================================================================
@@ -661,19 +852,79 @@ from .final_draft import (
 )
 
 
-def save_state_snapshot(output_dir: Path, state: Dict[str, Any]) -> None:
+# State keys never written to snapshots (messages are already shown in the log)
+_STATE_EXCLUDE = frozenset({"messages"})
+
+# Snapshots larger than this are written gzip-compressed as state.json.gz.
+# Typical runs stay well under it and keep a plain, greppable state.json.
+STATE_GZIP_THRESHOLD = 8 * 1024 * 1024
+
+
+def save_state_snapshot(output_dir: Path, state: Dict[str, Any]) -> Path:
     """
     Save complete workflow state for debugging.
 
     Args:
         output_dir: Directory to save artifacts
         state: Complete workflow state
+
+    Returns:
+        Path of the written snapshot (state.json, or state.json.gz when large)
     """
     # Filter out non-serializable data
     serializable_state = {
         k: v for k, v in state.items()
-        if k not in ["messages"] and not callable(v)
+        if k not in _STATE_EXCLUDE and not callable(v)
     }
 
-    with open(output_dir / "state.json", "w") as f:
-        json.dump(serializable_state, f, indent=2, default=str, ensure_ascii=False)
+    payload = dump_json_bytes(serializable_state, default=str)
+    plain_path = output_dir / "state.json"
+    gz_path = output_dir / "state.json.gz"
+
+    compress = len(payload) > STATE_GZIP_THRESHOLD
+    stale_path, state_path = (plain_path, gz_path) if compress else (gz_path, plain_path)
+
+    # Write a temp file, fsync, then rename over the snapshot: an interrupted
+    # run leaves the previous snapshot intact rather than a truncated one.
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb", buffering=1 << 20) as raw:
+            if compress:
+                # Stream through the 1 MiB buffered file instead of materializing
+                # the compressed copy. compresslevel=1: most of the size win at a
+                # fraction of the CPU; mtime=0 and an empty header filename keep
+                # output reproducible.
+                with gzip.GzipFile(filename="", mode="wb", compresslevel=1, fileobj=raw, mtime=0) as gz:
+                    gz.write(payload)
+            else:
+                raw.write(payload)
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_path, state_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    # Never leave an older snapshot in the other format next to the new one
+    stale_path.unlink(missing_ok=True)
+    return state_path
+
+
+def load_state_snapshot(output_dir: Path) -> Optional[Dict[str, Any]]:
+    """
+    Load a state snapshot written by save_state_snapshot.
+
+    Args:
+        output_dir: Artifact directory containing state.json or state.json.gz
+
+    Returns:
+        Snapshot dict, or None if no snapshot exists
+    """
+    try:
+        return json.loads((output_dir / "state.json").read_bytes())
+    except FileNotFoundError:
+        pass
+    try:
+        return json.loads(gzip.decompress((output_dir / "state.json.gz").read_bytes()))
+    except FileNotFoundError:
+        return None
@@ -16,13 +16,31 @@ Usage:
     brand = BrandConfig.load(config_path=Path("custom.yaml"))
 """
 
+import copy
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 from dataclasses import dataclass
 import yaml
 
+from ._yaml_cache import load_yaml_cached
 
-@dataclass
+_TEMPLATES_BRAND_DIR = os.path.join("templates", "brand-configs")
+_TEMPLATES_DEFAULT_CONFIG = os.path.join(_TEMPLATES_BRAND_DIR, "brand-config.yaml")
+_DEFAULT_CONFIG = "brand-config.yaml"
+
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+
+# brand-{name}-config.yaml; group 1 is the brand name
+_BRAND_RE = re.compile(r"brand-(.*)-config\.yaml", re.DOTALL)
+
+# list_available_brands results per (cwd, firm), with the directory mtimes they were built from
+_BRAND_LIST_CACHE: Dict[Tuple[str, Optional[str]], Tuple[Tuple[Optional[int], ...], list]] = {}
+
+
+@dataclass(slots=True)
 class BrandColors:
     """Brand color palette (hex codes).
 
@@ -48,9 +66,10 @@ class BrandColors:
     def from_config(cls, colors_data: dict) -> 'BrandColors':
         """Create BrandColors from config dict, supporting both flat and nested formats."""
         if 'light' in colors_data or 'dark' in colors_data:
-            # Nested format — extract light/dark sub-objects
-            light = colors_data.get('light', {})
-            dark = colors_data.get('dark', {})
+            # Nested format — extract light/dark sub-objects. colors_data belongs
+            # to the shared YAML parse cache, so the stored themes are deep copies.
+            light = copy.deepcopy(colors_data.get('light', {}))
+            dark = copy.deepcopy(colors_data.get('dark', {}))
             return cls(
                 primary=colors_data.get('primary', '#2d2d2d'),
                 secondary=colors_data.get('secondary', '#4a7c91'),
@@ -73,7 +92,7 @@ class BrandColors:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandFonts:
     """Font configuration.
 
@@ -95,7 +114,7 @@ class BrandFonts:
     header_weight: int = 700  # Default font weight for headers
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandCompany:
     """Company information."""
     name: str
@@ -103,7 +122,7 @@ class BrandCompany:
     confidential_footer: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandLogo:
     """Logo configuration with theme support."""
     light_mode: Optional[str] = None
@@ -113,7 +132,7 @@ class BrandLogo:
     alt: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandConfig:
     """Complete brand configuration."""
     company: BrandCompany
@@ -126,7 +145,8 @@ class BrandConfig:
         cls,
         brand_name: Optional[str] = None,
         config_path: Optional[Path] = None,
-        firm: Optional[str] = None
+        firm: Optional[str] = None,
+        verbose: bool = True
     ) -> 'BrandConfig':
         """Load brand configuration from YAML file.
 
@@ -134,6 +154,7 @@ class BrandConfig:
             brand_name: Name of brand (loads brand-{name}-config.yaml)
             config_path: Direct path to config file (overrides brand_name)
             firm: Firm name to check io/{firm}/configs/ for brand configs
+            verbose: Print which config file was loaded (batch callers pass False)
 
         Returns:
             BrandConfig instance
@@ -152,82 +173,71 @@ class BrandConfig:
             >>> BrandConfig.load(brand_name="hypernova", firm="hypernova")  # Checks io/hypernova/configs/ first
             >>> BrandConfig.load(config_path=Path("custom.yaml"))
         """
-        if config_path is None:
-            if brand_name:
-                # Priority order for brand-specific configs:
-                # 1. Firm-scoped: io/{firm}/configs/brand-{name}-config.yaml
-                # 2. Templates: templates/brand-configs/brand-{name}-config.yaml
-                # 3. Root: brand-{name}-config.yaml
-                search_paths = []
-
-                if firm:
-                    firm_config = Path(f"io/{firm}/configs/brand-{brand_name}-config.yaml")
-                    search_paths.append(firm_config)
-
-                search_paths.append(Path(f"templates/brand-configs/brand-{brand_name}-config.yaml"))
-                search_paths.append(Path(f"brand-{brand_name}-config.yaml"))
-
-                # Find first existing config
-                config_path = None
-                for path in search_paths:
-                    if path.exists():
-                        config_path = path
-                        break
-
-                # If none found, use last path for error message
-                if config_path is None:
-                    config_path = search_paths[-1]
-            else:
-                # If firm is provided but no brand_name, use firm as the brand name
-                if firm:
-                    # Search firm-scoped config first, then templates
-                    search_paths = [
-                        Path(f"io/{firm}/configs/brand-{firm}-config.yaml"),
-                        Path(f"templates/brand-configs/brand-{firm}-config.yaml"),
-                    ]
-                    config_path = None
-                    for path in search_paths:
-                        if path.exists():
-                            config_path = path
-                            break
-                    if config_path is None:
-                        # Fall back to default config
-                        config_path = Path("templates/brand-configs/brand-config.yaml")
-                        if not config_path.exists():
-                            config_path = Path("brand-config.yaml")
-                else:
-                    # Look for default config in templates/brand-configs/ first
-                    config_path = Path("templates/brand-configs/brand-config.yaml")
-                    if not config_path.exists():
-                        config_path = Path("brand-config.yaml")
-
-        if not config_path.exists():
-            if brand_name or (config_path != Path("brand-config.yaml")):
+        if config_path is not None:
+            candidates = [config_path]
+        elif brand_name:
+            # Priority order for brand-specific configs:
+            # 1. Firm-scoped: io/{firm}/configs/brand-{name}-config.yaml
+            # 2. Templates: templates/brand-configs/brand-{name}-config.yaml
+            # 3. Root: brand-{name}-config.yaml
+            # Candidates stay plain strings; only the winner becomes a Path
+            filename = f"brand-{brand_name}-config.yaml"
+            candidates = []
+            if firm:
+                candidates.append(os.path.join("io", firm, "configs", filename))
+            candidates.append(os.path.join(_TEMPLATES_BRAND_DIR, filename))
+            candidates.append(filename)
+        elif firm:
+            # If firm is provided but no brand_name, use firm as the brand name:
+            # firm-scoped config first, then templates, then the default config
+            filename = f"brand-{firm}-config.yaml"
+            candidates = [
+                os.path.join("io", firm, "configs", filename),
+                os.path.join(_TEMPLATES_BRAND_DIR, filename),
+                _TEMPLATES_DEFAULT_CONFIG,
+                _DEFAULT_CONFIG,
+            ]
+        else:
+            # Look for default config in templates/brand-configs/ first
+            candidates = [_TEMPLATES_DEFAULT_CONFIG, _DEFAULT_CONFIG]
+
+        # EAFP: try each candidate directly rather than exists() + open().
+        # Parses are shared through the content-hash cache in _yaml_cache.
+        found = False
+        for candidate in candidates:
+            try:
+                data = load_yaml_cached(candidate)
+            except FileNotFoundError:
+                continue
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML in {candidate}: {e}")
+            found = True
+            break
+
+        resolved_path = Path(candidate)
+        if not found:
+            # resolved_path is the last candidate, used for the message
+            if brand_name or (resolved_path != Path(_DEFAULT_CONFIG)):
                 # User specified a brand but file doesn't exist
                 raise FileNotFoundError(
-                    f"Brand config not found: {config_path}\n"
+                    f"Brand config not found: {resolved_path}\n"
                     f"Create the file or use --brand flag with an existing brand."
                 )
             # No config specified, use defaults
-            print(f"⚠️  Brand config not found: {config_path}")
+            print(f"⚠️  Brand config not found: {resolved_path}")
             print("   Using plain default branding.")
             print("   Create brand-config.yaml to customize.")
             return cls.get_default_config()
 
-        print(f"✓ Loading brand config: {config_path}")
-
-        try:
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML in {config_path}: {e}")
+        if verbose:
+            print(f"✓ Loading brand config: {resolved_path}")
 
         # Validate required sections
         required = ['company', 'colors', 'fonts']
         missing = [section for section in required if section not in data]
         if missing:
             raise ValueError(
-                f"Missing required sections in {config_path}: {', '.join(missing)}"
+                f"Missing required sections in {resolved_path}: {', '.join(missing)}"
             )
 
         try:
@@ -244,7 +254,7 @@ class BrandConfig:
             )
         except TypeError as e:
             raise ValueError(
-                f"Invalid brand config structure in {config_path}: {e}\n"
+                f"Invalid brand config structure in {resolved_path}: {e}\n"
                 f"See brand-config.example.yaml for correct format."
             )
 
@@ -282,54 +292,70 @@ class BrandConfig:
         Returns:
             List of brand names (without 'brand-' prefix and '-config.yaml' suffix)
         """
-        brands = []
-
-        # Check firm-scoped configs first (highest priority)
-        if firm:
-            firm_configs_dir = Path(f"io/{firm}/configs")
-            if firm_configs_dir.exists():
-                for config in firm_configs_dir.glob("brand-*-config.yaml"):
-                    name = config.name.replace("brand-", "").replace("-config.yaml", "")
-                    brands.append(name)
-
-        # Check templates/brand-configs/ directory
-        brand_configs_dir = Path("templates/brand-configs")
-        if brand_configs_dir.exists():
-            for config in brand_configs_dir.glob("brand-*-config.yaml"):
-                name = config.name.replace("brand-", "").replace("-config.yaml", "")
-                if name not in brands:  # Avoid duplicates
-                    brands.append(name)
-
-        # Check root directory (for backward compatibility)
-        for config in Path(".").glob("brand-*-config.yaml"):
-            name = config.name.replace("brand-", "").replace("-config.yaml", "")
-            if name not in brands:  # Avoid duplicates
-                brands.append(name)
-
-        return sorted(brands)
+        # Check firm-scoped configs first (highest priority),
+        # then templates/brand-configs/, then root directory (backward compatibility)
+        scan_dirs = [f"io/{firm}/configs"] if firm else []
+        scan_dirs += ["templates/brand-configs", "."]
+
+        # A directory's mtime changes whenever an entry is added, removed or
+        # renamed, so unchanged stamps mean the previous listing still holds
+        stamps = tuple(_dir_mtime_ns(scan_dir) for scan_dir in scan_dirs)
+        # Paths are cwd-relative, so the working directory is part of the key
+        cache_key = (os.getcwd(), firm)
+        cached = _BRAND_LIST_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamps:
+            return list(cached[1])
+
+        # dict keys dedupe in O(1) per name
+        brands: dict[str, None] = {}
+        for scan_dir in scan_dirs:
+            brands.update(dict.fromkeys(_scan_brand_names(scan_dir)))
+
+        result = sorted(brands)
+        _BRAND_LIST_CACHE[cache_key] = (stamps, result)
+        return list(result)
+
+
+def _dir_mtime_ns(dir_path: str) -> Optional[int]:
+    try:
+        return os.stat(dir_path).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
+def _scan_brand_names(dir_path: str) -> list[str]:
+    """Brand names from brand-*-config.yaml files in dir_path (missing dir -> [])."""
+    names = []
+    try:
+        # scandir yields names and file types from one readdir pass, no per-entry Path/stat
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                match = _BRAND_RE.fullmatch(entry.name)
+                if match and entry.is_file():
+                    names.append(match.group(1))
+    except FileNotFoundError:
+        pass
+    return names
+
+
+@lru_cache(maxsize=512)
 def validate_color(color: str) -> bool:
     """Validate hex color format."""
-    if not color.startswith("#"):
-        return False
-    if len(color) not in [4, 7]:  # #RGB or #RRGGBB
-        return False
-    try:
-        int(color[1:], 16)
-        return True
-    except ValueError:
-        return False
+    # #RGB or #RRGGBB; set difference keeps the check in C with no exception path
+    return (
+        color.startswith("#")
+        and len(color) in (4, 7)
+        and not set(color[1:]) - _HEX_CHARS
+    )
 
 
-def validate_brand_config(config: BrandConfig) -> list[str]:
-    """Validate brand configuration and return list of warnings.
+def iter_brand_config_warnings(config: BrandConfig) -> Iterator[str]:
+    """Yield brand configuration warnings lazily.
 
-    Returns:
-        List of warning messages (empty if all valid)
+    Filesystem checks (font directories, logo files) only run as the
+    iterator reaches them, so `next(iter_brand_config_warnings(cfg), None)`
+    stops at the first problem.
     """
-    warnings = []
-
     # Validate colors
     color_fields = [
         ('primary', config.colors.primary),
@@ -342,7 +368,7 @@ def validate_brand_config(config: BrandConfig) -> list[str]:
 
     for field_name, color_value in color_fields:
         if not validate_color(color_value):
-            warnings.append(
+            yield (
                 f"Invalid color '{field_name}': {color_value} "
                 f"(should be hex format like #1a3a52)"
             )
@@ -350,16 +376,16 @@ def validate_brand_config(config: BrandConfig) -> list[str]:
     # Validate body text custom fonts directory if specified
     if config.fonts.custom_fonts_dir:
         fonts_dir = Path(config.fonts.custom_fonts_dir)
-        if not fonts_dir.exists():
-            warnings.append(
+        fonts_dir_mtime = _dir_mtime_ns(str(fonts_dir))
+        if fonts_dir_mtime is None:
+            yield (
                 f"Body font directory not found: {fonts_dir}\n"
                 f"  Will fall back to system fonts."
             )
         else:
             # Check for at least one font file
-            font_files = list(fonts_dir.glob("*.woff2"))
-            if not font_files:
-                warnings.append(
+            if not _has_woff2(str(fonts_dir), fonts_dir_mtime):
+                yield (
                     f"No .woff2 font files found in: {fonts_dir}\n"
                     f"  Will fall back to system fonts."
                 )
@@ -367,23 +393,23 @@ def validate_brand_config(config: BrandConfig) -> list[str]:
     # Validate header fonts directory if specified
     if config.fonts.header_fonts_dir:
         header_fonts_dir = Path(config.fonts.header_fonts_dir)
-        if not header_fonts_dir.exists():
-            warnings.append(
+        header_fonts_dir_mtime = _dir_mtime_ns(str(header_fonts_dir))
+        if header_fonts_dir_mtime is None:
+            yield (
                 f"Header font directory not found: {header_fonts_dir}\n"
                 f"  Will fall back to body font or system fonts."
             )
         else:
             # Check for at least one font file
-            header_font_files = list(header_fonts_dir.glob("*.woff2"))
-            if not header_font_files:
-                warnings.append(
+            if not _has_woff2(str(header_fonts_dir), header_fonts_dir_mtime):
+                yield (
                     f"No .woff2 font files found in: {header_fonts_dir}\n"
                     f"  Will fall back to body font or system fonts."
                 )
 
     # Validate company name not empty
     if not config.company.name.strip():
-        warnings.append("Company name is empty")
+        yield "Company name is empty"
 
     # Validate logo paths if specified
     if config.logo:
@@ -392,7 +418,7 @@ def validate_brand_config(config: BrandConfig) -> list[str]:
             if not config.logo.light_mode.startswith(('http://', 'https://')):
                 light_logo_path = Path(config.logo.light_mode)
                 if not light_logo_path.exists():
-                    warnings.append(
+                    yield (
                         f"Light mode logo not found: {light_logo_path}\n"
                         f"  Will use text-based logo instead."
                     )
@@ -401,9 +427,32 @@ def validate_brand_config(config: BrandConfig) -> list[str]:
             if not config.logo.dark_mode.startswith(('http://', 'https://')):
                 dark_logo_path = Path(config.logo.dark_mode)
                 if not dark_logo_path.exists():
-                    warnings.append(
+                    yield (
                         f"Dark mode logo not found: {dark_logo_path}\n"
                         f"  Will use text-based logo instead."
                     )
 
-    return warnings
+
+def validate_brand_config(config: BrandConfig) -> list[str]:
+    """Validate brand configuration and return list of warnings.
+
+    Returns:
+        List of warning messages (empty if all valid)
+    """
+    return list(iter_brand_config_warnings(config))
+
+
+@lru_cache(maxsize=64)
+def _has_woff2(dir_str: str, mtime_ns: int) -> bool:
+    """True if dir_str contains at least one .woff2 entry (stops at the first).
+
+    Font directories such as templates/fonts/Arboria are shared between
+    brands; mtime_ns is part of the cache key so added or removed files
+    are picked up.
+    """
+    try:
+        with os.scandir(dir_str) as it:
+            return any(entry.name.endswith(".woff2") for entry in it)
+    except OSError:
+        # Not a directory or unreadable: Path.glob() also found nothing here
+        return False
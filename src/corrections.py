@@ -9,10 +9,11 @@ for investment memos.
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 from pathlib import Path
-import yaml
 
+from ._yaml_cache import load_yaml_cached
 
-@dataclass
+
+@dataclass(slots=True)
 class CorrectionObject:
     """Represents a single correction from YAML."""
 
@@ -28,7 +29,7 @@ class CorrectionObject:
     update_research: bool = False  # Whether to update research artifacts
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrectionsConfig:
     """Complete corrections configuration from YAML."""
 
@@ -53,14 +54,17 @@ def load_corrections_yaml(corrections_file: Path) -> CorrectionsConfig:
         ValueError: If YAML is invalid or missing required fields
         FileNotFoundError: If file doesn't exist
     """
-    if not corrections_file.exists():
+    try:
+        data = load_yaml_cached(corrections_file)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Corrections file not found: {corrections_file}")
 
-    with open(corrections_file) as f:
-        data = yaml.safe_load(f)
-
-    # Validate schema
-    validate_corrections_schema(data)
+    # Validate top-level schema, then validate and parse each correction in one pass
+    _validate_top_level(data)
+    corrections = []
+    for i, corr in enumerate(data["corrections"]):
+        validate_correction_object(corr, i + 1)
+        corrections.append(_parse_correction(corr))
 
     # Parse into CorrectionsConfig
     config = CorrectionsConfig(
@@ -68,12 +72,15 @@ def load_corrections_yaml(corrections_file: Path) -> CorrectionsConfig:
         source_version=data["source_version"],
         output_mode=data["output_mode"],
         date_created=data.get("date_created"),
-        corrections=parse_corrections(data["corrections"])
+        corrections=corrections
     )
 
     return config
 
 
+_OUTPUT_MODES = frozenset({"new_version", "in_place"})
+
+
 def validate_corrections_schema(data: dict) -> None:
     """
     Validate YAML structure and required fields.
@@ -84,6 +91,15 @@ def validate_corrections_schema(data: dict) -> None:
     Raises:
         ValueError: If schema is invalid
     """
+    _validate_top_level(data)
+
+    # Validate each correction
+    for i, corr in enumerate(data["corrections"]):
+        validate_correction_object(corr, i + 1)
+
+
+def _validate_top_level(data: dict) -> None:
+    """Validate the top-level fields and the shape of the corrections list."""
     # Validate top-level fields
     required_top = ["company", "source_version", "output_mode", "corrections"]
     for field in required_top:
@@ -91,7 +107,7 @@ def validate_corrections_schema(data: dict) -> None:
             raise ValueError(f"Missing required field: {field}")
 
     # Validate output_mode
-    if data["output_mode"] not in ["new_version", "in_place"]:
+    if data["output_mode"] not in _OUTPUT_MODES:
         raise ValueError(
             f"Invalid output_mode: {data['output_mode']}. "
             "Must be 'new_version' or 'in_place'"
@@ -104,9 +120,18 @@ def validate_corrections_schema(data: dict) -> None:
     if len(data["corrections"]) == 0:
         raise ValueError("'corrections' list cannot be empty")
 
-    # Validate each correction
-    for i, corr in enumerate(data["corrections"]):
-        validate_correction_object(corr, i + 1)
+
+# Per-type validation rules: (required fields in report order, the same fields as
+# a frozenset for a C-level subset check, the field that must be a non-empty list)
+_CORRECTION_RULES = {
+    corr_type: (required, frozenset(required), list_field)
+    for corr_type, required, list_field in (
+        ("inaccurate", ("inaccurate_information", "correct_information", "affected_sections"), "affected_sections"),
+        ("incomplete", ("incomplete_information", "additional_information", "affected_sections"), "affected_sections"),
+        ("narrative", ("section", "narrative_shaping_comments"), "narrative_shaping_comments"),
+        ("mixed", ("affected_sections",), "affected_sections"),
+    )
+}
 
 
 def validate_correction_object(corr: dict, index: int) -> None:
@@ -124,43 +149,23 @@ def validate_correction_object(corr: dict, index: int) -> None:
         raise ValueError(f"Correction {index}: Missing 'type' field")
 
     corr_type = corr["type"]
+    rule = _CORRECTION_RULES.get(corr_type) if isinstance(corr_type, str) else None
+    if rule is None:
+        raise ValueError(
+            f"Correction {index}: Invalid type '{corr_type}'. "
+            "Must be 'inaccurate', 'incomplete', 'narrative', or 'mixed'"
+        )
 
-    if corr_type == "inaccurate":
-        required = ["inaccurate_information", "correct_information", "affected_sections"]
-        for field_name in required:
-            if field_name not in corr:
-                raise ValueError(f"Correction {index} (inaccurate): Missing '{field_name}'")
-
-        if not isinstance(corr["affected_sections"], list) or len(corr["affected_sections"]) == 0:
-            raise ValueError(f"Correction {index}: 'affected_sections' must be a non-empty list")
-
-    elif corr_type == "incomplete":
-        required = ["incomplete_information", "additional_information", "affected_sections"]
-        for field_name in required:
-            if field_name not in corr:
-                raise ValueError(f"Correction {index} (incomplete): Missing '{field_name}'")
-
-        if not isinstance(corr["affected_sections"], list) or len(corr["affected_sections"]) == 0:
-            raise ValueError(f"Correction {index}: 'affected_sections' must be a non-empty list")
-
-    elif corr_type == "narrative":
-        required = ["section", "narrative_shaping_comments"]
-        for field_name in required:
-            if field_name not in corr:
-                raise ValueError(f"Correction {index} (narrative): Missing '{field_name}'")
-
-        if not isinstance(corr["narrative_shaping_comments"], list) or len(corr["narrative_shaping_comments"]) == 0:
-            raise ValueError(f"Correction {index}: 'narrative_shaping_comments' must be a non-empty list")
-
-    elif corr_type == "mixed":
-        required = ["affected_sections"]
-        for field_name in required:
-            if field_name not in corr:
-                raise ValueError(f"Correction {index} (mixed): Missing '{field_name}'")
+    required, required_set, list_field = rule
+    if not required_set <= corr.keys():
+        # Report the first missing field in declaration order
+        field_name = next(name for name in required if name not in corr)
+        raise ValueError(f"Correction {index} ({corr_type}): Missing '{field_name}'")
 
-        if not isinstance(corr["affected_sections"], list) or len(corr["affected_sections"]) == 0:
-            raise ValueError(f"Correction {index}: 'affected_sections' must be a non-empty list")
+    if not isinstance(corr[list_field], list) or len(corr[list_field]) == 0:
+        raise ValueError(f"Correction {index}: '{list_field}' must be a non-empty list")
 
+    if corr_type == "mixed":
         # Mixed must have at least one of: inaccurate, incomplete, or narrative
         has_inaccurate = "inaccurate_information" in corr and "correct_information" in corr
         has_incomplete = "incomplete_information" in corr and "additional_information" in corr
@@ -172,12 +177,6 @@ def validate_correction_object(corr: dict, index: int) -> None:
                 "inaccurate info, incomplete info, or narrative comments"
             )
 
-    else:
-        raise ValueError(
-            f"Correction {index}: Invalid type '{corr_type}'. "
-            "Must be 'inaccurate', 'incomplete', 'narrative', or 'mixed'"
-        )
-
 
 def parse_corrections(corrections_list: list) -> List[CorrectionObject]:
     """
@@ -189,23 +188,46 @@ def parse_corrections(corrections_list: list) -> List[CorrectionObject]:
     Returns:
         List of CorrectionObject instances
     """
-    corrections = []
+    return [_parse_correction(corr) for corr in corrections_list]
+
+
+def _parse_correction(corr: dict) -> CorrectionObject:
+    """Build a CorrectionObject from one validated correction dictionary."""
+    # corr belongs to the shared YAML parse cache: copy its lists so callers
+    # can edit a CorrectionObject without changing later loads of the file
+    return CorrectionObject(
+        type=corr["type"],
+        inaccurate_info=corr.get("inaccurate_information"),
+        correct_info=corr.get("correct_information"),
+        incomplete_info=corr.get("incomplete_information"),
+        additional_info=corr.get("additional_information"),
+        affected_sections=list(corr.get("affected_sections", [])),
+        section=corr.get("section"),
+        sources=list(corr.get("sources", [])),
+        narrative_comments=list(corr.get("narrative_shaping_comments", [])),
+        update_research=corr.get("update_research", False)
+    )
+
+
+def _mixed_summary(correction: CorrectionObject) -> str:
+    """Summary for a "mixed" correction, naming each kind of change it makes."""
+    parts = []
+    if correction.inaccurate_info:
+        parts.append("correct inaccuracies")
+    if correction.incomplete_info:
+        parts.append("add missing info")
+    if correction.narrative_comments:
+        parts.append("improve narrative")
+    return f"{', '.join(parts).capitalize()} in {len(correction.affected_sections)} section(s)"
 
-    for corr in corrections_list:
-        corrections.append(CorrectionObject(
-            type=corr["type"],
-            inaccurate_info=corr.get("inaccurate_information"),
-            correct_info=corr.get("correct_information"),
-            incomplete_info=corr.get("incomplete_information"),
-            additional_info=corr.get("additional_information"),
-            affected_sections=corr.get("affected_sections", []),
-            section=corr.get("section"),
-            sources=corr.get("sources", []),
-            narrative_comments=corr.get("narrative_shaping_comments", []),
-            update_research=corr.get("update_research", False)
-        ))
 
-    return corrections
+# Summary formatter per correction type
+_SUMMARY_FORMATTERS = {
+    "inaccurate": lambda c: f"Correct inaccurate info in {len(c.affected_sections)} section(s)",
+    "incomplete": lambda c: f"Add missing info to {len(c.affected_sections)} section(s)",
+    "narrative": lambda c: f"Improve narrative in section: {c.section}",
+    "mixed": _mixed_summary,
+}
 
 
 def get_correction_summary(correction: CorrectionObject) -> str:
@@ -218,19 +240,7 @@ def get_correction_summary(correction: CorrectionObject) -> str:
     Returns:
         String summary of the correction
     """
-    if correction.type == "inaccurate":
-        return f"Correct inaccurate info in {len(correction.affected_sections)} section(s)"
-    elif correction.type == "incomplete":
-        return f"Add missing info to {len(correction.affected_sections)} section(s)"
-    elif correction.type == "narrative":
-        return f"Improve narrative in section: {correction.section}"
-    elif correction.type == "mixed":
-        parts = []
-        if correction.inaccurate_info:
-            parts.append("correct inaccuracies")
-        if correction.incomplete_info:
-            parts.append("add missing info")
-        if correction.narrative_comments:
-            parts.append("improve narrative")
-        return f"{', '.join(parts).capitalize()} in {len(correction.affected_sections)} section(s)"
-    return "Unknown correction type"
+    formatter = _SUMMARY_FORMATTERS.get(correction.type)
+    if formatter is None:
+        return "Unknown correction type"
+    return formatter(correction)
@@ -16,8 +16,10 @@ Current naming convention: 6-{Deal}-{Version}.md
 Legacy naming (for backwards compatibility): 4-final-draft.md
 """
 
+import os
+import re
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 
 # =============================================================================
@@ -27,6 +29,23 @@ from typing import Optional, Union
 FINAL_DRAFT_PREFIX = "7"
 LEGACY_FILENAME = "4-final-draft.md"
 
+# Compiled once; Path.glob() re-translates its fnmatch pattern on every call
+_FINAL_DRAFT_RE = re.compile(rf"{re.escape(FINAL_DRAFT_PREFIX)}-.*\.md", re.DOTALL)
+_OLD_PREFIX_DRAFT_RE = re.compile(r"6-.*-v.*\.md", re.DOTALL)
+
+# All three batch-export patterns in one pass; the named group that matched
+# says which priority bucket the file belongs to
+_DRAFT_FILE_RE = re.compile(
+    rf"(?P<new>{re.escape(FINAL_DRAFT_PREFIX)}-.*\.md)"
+    rf"|(?P<legacy>{re.escape(LEGACY_FILENAME)})"
+    r"|(?P<memo>.*-memo\.md)",
+    re.DOTALL,
+)
+
+# Pre-joined affixes for the per-name checks in batch scans
+_FINAL_DRAFT_STARTS = (f"{FINAL_DRAFT_PREFIX}-",)
+_FINAL_DRAFT_ENDS = ("-memo.md",)
+
 
 # =============================================================================
 # FILENAME AND PATH GENERATION
@@ -66,11 +85,18 @@ def get_final_draft_path(output_dir: Path) -> Path:
 # FINDING EXISTING DRAFTS (with legacy fallback)
 # =============================================================================
 
+# output_dir -> (directory st_mtime_ns, resolved draft path). Any file being
+# added, removed or renamed bumps the directory mtime, so a matching stamp
+# means the previous lookup still holds.
+_DRAFT_CACHE: Dict[Path, Tuple[int, Optional[Path]]] = {}
+
+
 def find_final_draft(output_dir: Path) -> Optional[Path]:
     """
     Find the final draft file in an output directory.
 
     Tries new naming convention first, falls back to legacy naming.
+    Results are cached per directory and revalidated with a single stat.
 
     Args:
         output_dir: Output directory path
@@ -78,27 +104,48 @@ def find_final_draft(output_dir: Path) -> Optional[Path]:
     Returns:
         Path to final draft if found, None otherwise
     """
-    # Try current naming pattern first: 7-{Deal}-{Version}.md
-    new_pattern_files = list(output_dir.glob(f"{FINAL_DRAFT_PREFIX}-*.md"))
-    if new_pattern_files:
-        return new_pattern_files[0]
+    try:
+        mtime = output_dir.stat().st_mtime_ns
+    except OSError:
+        return None
 
-    # Fall back to previous prefix (6-)
-    old_prefix_files = list(output_dir.glob("6-*-v*.md"))
-    if old_prefix_files:
-        return old_prefix_files[0]
+    cached = _DRAFT_CACHE.get(output_dir)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
-    # Fall back to legacy naming
-    legacy_path = output_dir / LEGACY_FILENAME
-    if legacy_path.exists():
-        return legacy_path
+    draft_path = _scan_final_draft(output_dir)
+    _DRAFT_CACHE[output_dir] = (mtime, draft_path)
+    return draft_path
 
-    # Try other memo patterns
-    memo_files = list(output_dir.glob("*-memo.md"))
-    if memo_files:
-        return memo_files[0]
 
-    return None
+def _scan_final_draft(output_dir: Path) -> Optional[Path]:
+    """
+    Uncached lookup behind find_final_draft().
+
+    Classifies every entry in one scandir pass instead of globbing the
+    directory once per naming pattern, then picks by priority:
+    7-{Deal}-{Version}.md, 6-{Deal}-v{Version}.md, 4-final-draft.md,
+    then *-memo.md.
+    """
+    new_pattern = old_prefix = legacy = memo = None
+
+    try:
+        with os.scandir(output_dir) as it:
+            for entry in it:
+                name = entry.name
+                if new_pattern is None and _FINAL_DRAFT_RE.fullmatch(name):
+                    new_pattern = name
+                elif old_prefix is None and _OLD_PREFIX_DRAFT_RE.fullmatch(name):
+                    old_prefix = name
+                elif name == LEGACY_FILENAME:
+                    legacy = name
+                elif memo is None and name.endswith("-memo.md"):
+                    memo = name
+    except OSError:
+        return None
+
+    found = new_pattern or old_prefix or legacy or memo
+    return output_dir / found if found else None
 
 
 def final_draft_exists(output_dir: Path) -> bool:
@@ -151,6 +198,7 @@ def write_final_draft(output_dir: Path, content: str) -> Path:
     """
     draft_path = get_final_draft_path(output_dir)
     draft_path.write_text(content, encoding="utf-8")
+    _DRAFT_CACHE.pop(output_dir, None)
     return draft_path
 
 
@@ -185,35 +233,80 @@ def find_all_final_drafts(search_dir: Path, recursive: bool = True) -> list[Path
     Returns:
         List of paths to final draft files
     """
-    pattern = "**/" if recursive else ""
+    new_pattern, legacy, memo = _scan_all_final_drafts(search_dir, recursive)
+
+    # New naming pattern first, then legacy naming, then the memo pattern
+    return new_pattern or legacy or memo
+
+
+def _scan_all_final_drafts(
+    search_dir: Path, recursive: bool
+) -> Tuple[list[Path], list[Path], list[Path]]:
+    """
+    Walk search_dir once, sorting draft files by naming pattern.
 
-    # Try new naming pattern first
-    files = list(search_dir.glob(f"{pattern}{FINAL_DRAFT_PREFIX}-*.md"))
+    Uses an explicit stack of directories (pre-order, not following
+    symlinked directories) so results come out in the same order the
+    previous three recursive globs produced, from a single traversal.
+    Path objects are only created for matching entries.
+    """
+    buckets: Dict[str, list[Path]] = {"new": [], "legacy": [], "memo": []}
+    match_name = _DRAFT_FILE_RE.fullmatch
+
+    stack = [os.fspath(search_dir)]
+    while stack:
+        dir_path = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    match = match_name(entry.name)
+                    if match:
+                        buckets[match.lastgroup].append(Path(entry.path))
+                    if recursive:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                        except OSError:
+                            pass
+        except OSError:
+            continue
+        # Reversed so the first subdirectory is walked next (pre-order)
+        stack.extend(reversed(subdirs))
+
+    return buckets["new"], buckets["legacy"], buckets["memo"]
+
+
+def is_final_draft_file_name(name: str) -> bool:
+    """
+    Check if a bare filename looks like a final draft.
 
-    if not files:
-        # Fall back to legacy naming
-        files = list(search_dir.glob(f"{pattern}{LEGACY_FILENAME}"))
+    String-only variant of is_final_draft_file() for scan loops that
+    already hold DirEntry.name.
 
-    if not files:
-        # Try memo pattern
-        files = list(search_dir.glob(f"{pattern}*-memo.md"))
+    Args:
+        name: Filename (no directory part)
 
-    return files
+    Returns:
+        True if the name matches a final draft naming pattern
+    """
+    return (
+        name.startswith(_FINAL_DRAFT_STARTS) or
+        name.endswith(_FINAL_DRAFT_ENDS) or
+        name == LEGACY_FILENAME
+    )
 
 
-def is_final_draft_file(file_path: Path) -> bool:
+def is_final_draft_file(file_path: Union[str, Path]) -> bool:
     """
     Check if a file is a final draft based on its name.
 
     Args:
-        file_path: Path to check
+        file_path: Path to check, or a bare filename (e.g. DirEntry.name)
 
     Returns:
         True if the file appears to be a final draft
     """
-    name = file_path.name
-    return (
-        name.startswith(f"{FINAL_DRAFT_PREFIX}-") or
-        name == LEGACY_FILENAME or
-        name.endswith("-memo.md")
+    return is_final_draft_file_name(
+        file_path if isinstance(file_path, str) else file_path.name
     )
@@ -7,34 +7,18 @@ Run this script to generate an investment memo for a company.
 import os
 import sys
 import argparse
+from itertools import islice
 from pathlib import Path
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
-import json
-
-from .workflow import generate_memo
-from .versioning import VersionManager, format_version_history
+
+# rich, dotenv and the workflow (LangGraph + agents) are imported inside main()
+# once arguments are parsed, so --help and usage errors skip their import cost.
+from .versioning import VersionManager
 from .utils import get_latest_output_dir
-from .artifacts import sanitize_filename
+from .artifacts import sanitize_filename, save_state_snapshot
 
 
 def main():
     """Main execution function."""
-    console = Console()
-
-    # Load environment variables
-    load_dotenv()
-
-    # Check for API key
-    if not os.getenv("ANTHROPIC_API_KEY"):
-        console.print("[bold red]Error:[/bold red] ANTHROPIC_API_KEY not set in environment")
-        console.print("Please set it in .env file or environment variables")
-        sys.exit(1)
-
     # Parse command line arguments
     parser = argparse.ArgumentParser(
         description="Generate investment memos using multi-agent AI orchestration"
@@ -87,6 +71,20 @@ def main():
 
     args = parser.parse_args()
 
+    from dotenv import load_dotenv
+    from rich.console import Console
+
+    console = Console()
+
+    # Load environment variables
+    load_dotenv()
+
+    # Check for API key
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        console.print("[bold red]Error:[/bold red] ANTHROPIC_API_KEY not set in environment")
+        console.print("Please set it in .env file or environment variables")
+        sys.exit(1)
+
     # Get company/deal name from args or prompt
     # Priority: --deal flag > positional argument > prompt
     if args.deal:
@@ -137,17 +135,13 @@ def main():
         console.print(f"[bold cyan]Resume mode enabled[/bold cyan]")
         console.print(f"Found artifacts: {output_dir}\n")
 
-        # Import and run resume functions
-        import subprocess
-        resume_cmd = [sys.executable, "cli/resume_from_interruption.py"]
-        if firm:
-            resume_cmd += ["--firm", firm, "--deal", company_name]
-        else:
-            resume_cmd += [company_name]
+        # Run the resume entrypoint in-process (no second interpreter start-up)
+        from cli.resume_from_interruption import main as resume_main
+        resume_argv = ["--firm", firm, "--deal", company_name] if firm else [company_name]
         if args.set_version:
-            resume_cmd += ["--version", args.set_version]
-        result = subprocess.run(resume_cmd, cwd=Path(__file__).parent.parent)
-        sys.exit(result.returncode)
+            resume_argv += ["--version", args.set_version]
+        resume_main(resume_argv)
+        sys.exit(0)
 
     # Load company/deal data using new path resolution
     # Priority: io/{firm}/deals/{deal}/ > data/{deal}.json
@@ -337,6 +331,13 @@ def main():
         console.print(f"[bold cyan]Deck:[/bold cyan] Analyzing pitch deck")
     console.print()
 
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    from .workflow import generate_memo
+
     # Run workflow with progress indicators
     try:
         with Progress(
@@ -371,44 +372,49 @@ def main():
 
             progress.update(task, description="[bold green]✓ Memo generation complete!")
 
-        # Display results
-        console.print("\n" + "="*80 + "\n")
-        console.print(Panel("[bold cyan]WORKFLOW SUMMARY[/bold cyan]", expand=False))
-
-        # Show messages
-        messages = final_state.get("messages", [])
-        for msg in messages:
-            console.print(f"  • {msg}")
-
-        # Show validation score
-        score = final_state.get("overall_score", 0.0)
-        score_color = "green" if score >= 8 else "yellow" if score >= 6 else "red"
-        console.print(f"\n[bold]Validation Score:[/bold] [{score_color}]{score}/10[/{score_color}]")
-
-        # Show scorecard results if available
-        scorecard_results = final_state.get("scorecard_results")
-        if scorecard_results:
-            sc_score = scorecard_results.get("overall_score", 0)
-            sc_strengths = len(scorecard_results.get("strengths", []))
-            sc_concerns = len(scorecard_results.get("concerns", []))
-            sc_color = "green" if sc_score >= 4 else "yellow" if sc_score >= 3 else "red"
-            console.print(f"[bold]Scorecard Score:[/bold] [{sc_color}]{sc_score:.1f}/5[/{sc_color}] ({sc_strengths} strengths, {sc_concerns} concerns)")
-
-        # Show validation feedback if available
-        validation = final_state.get("validation_results", {}).get("full_memo", {})
-        if validation:
-            issues = validation.get("issues", [])
-            suggestions = validation.get("suggestions", [])
-
-            if issues:
-                console.print("\n[bold yellow]Issues Identified:[/bold yellow]")
-                for issue in issues:
-                    console.print(f"  • {issue}")
-
-            if suggestions:
-                console.print("\n[bold cyan]Suggestions:[/bold cyan]")
-                for suggestion in suggestions:
-                    console.print(f"  • {suggestion}")
+        # Display results. The summary is rendered into a capture buffer and
+        # written once, instead of one stdout write per message/issue line.
+        with console.capture() as summary:
+            console.print("\n" + "="*80 + "\n")
+            console.print(Panel("[bold cyan]WORKFLOW SUMMARY[/bold cyan]", expand=False))
+
+            # Show messages
+            messages = final_state.get("messages", [])
+            for msg in messages:
+                console.print(f"  • {msg}")
+
+            # Show validation score
+            score = final_state.get("overall_score", 0.0)
+            score_color = "green" if score >= 8 else "yellow" if score >= 6 else "red"
+            console.print(f"\n[bold]Validation Score:[/bold] [{score_color}]{score}/10[/{score_color}]")
+
+            # Show scorecard results if available
+            scorecard_results = final_state.get("scorecard_results")
+            if scorecard_results:
+                sc_score = scorecard_results.get("overall_score", 0)
+                sc_strengths = len(scorecard_results.get("strengths", []))
+                sc_concerns = len(scorecard_results.get("concerns", []))
+                sc_color = "green" if sc_score >= 4 else "yellow" if sc_score >= 3 else "red"
+                console.print(f"[bold]Scorecard Score:[/bold] [{sc_color}]{sc_score:.1f}/5[/{sc_color}] ({sc_strengths} strengths, {sc_concerns} concerns)")
+
+            # Show validation feedback if available
+            validation = final_state.get("validation_results", {}).get("full_memo", {})
+            if validation:
+                issues = validation.get("issues", [])
+                suggestions = validation.get("suggestions", [])
+
+                if issues:
+                    console.print("\n[bold yellow]Issues Identified:[/bold yellow]")
+                    for issue in issues:
+                        console.print(f"  • {issue}")
+
+                if suggestions:
+                    console.print("\n[bold cyan]Suggestions:[/bold cyan]")
+                    for suggestion in suggestions:
+                        console.print(f"  • {suggestion}")
+
+        console.file.write(summary.get())
+        console.file.flush()
 
         # Get the memo content (either finalized or draft)
         final_memo = final_state.get("final_memo")
@@ -458,14 +464,13 @@ def main():
 
             # Final draft uses canonical path from final_draft module
             # The pipeline agents already create this file via citation_enrichment/assemble_draft
-            from .final_draft import get_final_draft_path
+            from .final_draft import get_final_draft_path, write_final_draft
             final_draft_file = get_final_draft_path(version_output_dir)
 
             # If the pipeline created the file, it's the canonical version
-            # Otherwise, write the memo content as the final draft
+            # Otherwise, write the memo content as the final draft (one UTF-8 write)
             if not final_draft_file.exists() and memo_content:
-                with open(final_draft_file, "w") as f:
-                    f.write(memo_content)
+                write_final_draft(version_output_dir, memo_content)
 
             # Record version with the new canonical filename
             from .final_draft import get_final_draft_filename
@@ -484,22 +489,18 @@ def main():
             color = "green" if is_finalized else "yellow"
             console.print(Panel(f"[bold {color}]{title}[/bold {color}]", expand=False))
             console.print("\n")
-            md = Markdown(memo_content)
-            console.print(md)
+            if console.is_terminal:
+                console.print(Markdown(memo_content))
+            else:
+                # Piped/redirected: raw markdown, skipping the parse and styling pass
+                console.print(memo_content, markup=False, highlight=False, emoji=False, soft_wrap=True)
 
             status_msg = "Memo saved to" if is_finalized else "Draft saved to"
             console.print(f"\n[bold green]✓ {status_msg}:[/bold green] {final_draft_file}")
 
             # Save full state as JSON for debugging
-            # Uses canonical location: state.json inside version directory
-            state_file = version_output_dir / "state.json"
-            with open(state_file, "w") as f:
-                # Convert state to serializable format
-                serializable_state = {
-                    k: v for k, v in final_state.items()
-                    if k not in ["messages"]  # Skip messages, already shown
-                }
-                json.dump(serializable_state, f, indent=2, default=str)
+            # Uses canonical location: state.json (or state.json.gz) inside version directory
+            state_file = save_state_snapshot(version_output_dir, final_state)
 
             console.print(f"[dim]Full state saved to: {state_file}[/dim]")
 
@@ -513,7 +514,7 @@ def main():
                 table.add_column("Status")
                 table.add_column("Date")
 
-                for entry in history[-5:]:  # Show last 5 versions
+                for entry in islice(history, max(0, len(history) - 5), None):  # Show last 5 versions
                     status_icon = "✓" if entry["is_finalized"] else "⚠"
                     score_color = "green" if entry["validation_score"] >= 8 else "yellow" if entry["validation_score"] >= 6 else "red"
                     table.add_row(
@@ -21,6 +21,11 @@ from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Default paths
 DEFAULT_IO_ROOT = Path("io")
@@ -225,11 +230,16 @@ def load_deal_config(ctx: DealContext) -> Dict[str, Any]:
     Raises:
         FileNotFoundError: If deal config doesn't exist
     """
-    if not ctx.deal_json_path or not ctx.deal_json_path.exists():
+    if not ctx.deal_json_path:
         raise FileNotFoundError(f"Deal config not found: {ctx.deal_json_path}")
 
-    with open(ctx.deal_json_path) as f:
-        config = json.load(f)
+    # EAFP: one open instead of exists() + open. One read of the raw bytes;
+    # orjson parses UTF-8 directly when installed.
+    try:
+        raw = ctx.deal_json_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Deal config not found: {ctx.deal_json_path}")
+    config = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     # Resolve relative paths in config
     if not ctx.is_legacy and ctx.inputs_dir:
@@ -265,9 +275,9 @@ def resolve_deal_paths(
     """
     ctx = resolve_deal_context(deal_name, firm, io_root)
 
-    if ctx.exists():
+    try:
         config = load_deal_config(ctx)
-    else:
+    except FileNotFoundError:
         config = {}
 
     return ctx, config
@@ -296,14 +306,57 @@ def get_latest_output_dir_for_deal(ctx: DealContext) -> Path:
     if not outputs_dir or not outputs_dir.exists():
         raise FileNotFoundError(f"Outputs directory not found: {outputs_dir}")
 
-    # Find all matching directories
-    matching_dirs = [p for p in outputs_dir.glob(f"{safe_name}-v*") if p.is_dir()]
-
-    if not matching_dirs:
+    latest = find_latest_version_dir(outputs_dir, safe_name)
+    if latest is None:
         raise FileNotFoundError(f"No output directory found for {ctx.deal_name} in {outputs_dir}")
 
-    # Get the most recent one (highest version by name)
-    return max(matching_dirs, key=lambda p: p.name)
+    return latest
+
+
+# (outputs_dir, safe_name) -> (outputs_dir st_mtime_ns, latest version dir).
+# Creating or removing a version directory bumps the parent's mtime.
+_LATEST_DIR_CACHE: Dict[Tuple[str, str], Tuple[int, Optional[Path]]] = {}
+
+
+def find_latest_version_dir(outputs_dir: Path, safe_name: str) -> Optional[Path]:
+    """
+    Find the highest {safe_name}-v* directory in outputs_dir.
+
+    Agents resolve the output directory repeatedly during a run, so the
+    result is cached and revalidated with a single stat of outputs_dir.
+
+    Args:
+        outputs_dir: Directory holding versioned output directories
+        safe_name: Sanitized deal/company name
+
+    Returns:
+        Path to the most recent version directory (highest by name),
+        or None if there is none
+    """
+    try:
+        mtime = outputs_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    key = (os.fspath(outputs_dir), safe_name)
+    cached = _LATEST_DIR_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    prefix = f"{safe_name}-v"
+    latest_name = None
+    try:
+        with os.scandir(outputs_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and (latest_name is None or name > latest_name) and entry.is_dir():
+                    latest_name = name
+    except OSError:
+        return None
+
+    latest = outputs_dir / latest_name if latest_name else None
+    _LATEST_DIR_CACHE[key] = (mtime, latest)
+    return latest
 
 
 def create_output_dir_for_deal(ctx: DealContext, version: str) -> Path:
@@ -68,7 +68,7 @@ def get_latest_output_dir(
     Raises:
         FileNotFoundError: If no output directory exists
     """
-    from .paths import resolve_deal_context, get_latest_output_dir_for_deal
+    from .paths import resolve_deal_context, get_latest_output_dir_for_deal, find_latest_version_dir
 
     # Try firm-scoped resolution first
     ctx = resolve_deal_context(company_name, firm=firm, io_root=io_root)
@@ -84,10 +84,9 @@ def get_latest_output_dir(
     safe_name = sanitize_filename(company_name)
     output_base = Path("output")
 
-    # Find all matching directories (exclude files)
-    matching_dirs = [p for p in output_base.glob(f"{safe_name}-v*") if p.is_dir()]
-    if not matching_dirs:
+    # Most recent matching directory (highest version by name)
+    latest = find_latest_version_dir(output_base, safe_name)
+    if latest is None:
         raise FileNotFoundError(f"No output directory found for {company_name}")
 
-    # Get the most recent one (highest version by name)
-    return max(matching_dirs, key=lambda p: p.name)
+    return latest
@@ -174,8 +174,11 @@ class VersionManager:
         """Save versions data to JSON."""
         # Ensure parent directory exists
         self.versions_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.versions_file, "w") as f:
-            json.dump(self.versions_data, f, indent=2)
+        # Write a sibling temp file and swap it in, so an interrupted run never
+        # leaves a truncated versions.json behind for the next get_next_version()
+        tmp_file = self.versions_file.with_name(self.versions_file.name + ".tmp")
+        tmp_file.write_text(json.dumps(self.versions_data, indent=2))
+        os.replace(tmp_file, self.versions_file)
 
     def get_deal_output_dir(self, deal_name: str, version: Optional[MemoVersion] = None) -> Path:
         """
@@ -263,11 +263,11 @@ def finalize_memo(state: MemoState) -> dict:
 
     # Save state snapshot
     try:
-        save_state_snapshot(output_dir, state)
+        state_path = save_state_snapshot(output_dir, state)
         print(f"✓ State snapshot saved")
 
         print(f"\n🎉 Final draft ready: {final_draft_path}")
-        print(f"State snapshot saved to: {output_dir / 'state.json'}")
+        print(f"State snapshot saved to: {state_path}")
     except Exception as e:
         print(f"Warning: Could not save final draft artifacts: {e}")
 
@@ -313,10 +313,10 @@ def human_review(state: MemoState) -> dict:
             final_draft_path = get_final_draft_path(output_dir)
 
         # Save state snapshot
-        save_state_snapshot(output_dir, state)
+        state_path = save_state_snapshot(output_dir, state)
 
         print(f"Draft saved for review to: {final_draft_path}")
-        print(f"State snapshot saved to: {output_dir / 'state.json'}")
+        print(f"State snapshot saved to: {state_path}")
     except Exception as e:
         print(f"Warning: Could not save draft artifacts: {e}")
 
@@ -618,9 +618,12 @@ def generate_memo(
         Final state containing research, draft, validation, scorecard evaluation, and final memo
     """
     from .state import create_initial_state
-    from .artifacts import sanitize_filename, create_artifact_directory
+    from .artifacts import sanitize_filename, create_artifact_directory, reset_run_timestamp
     from .versioning import MemoVersion
 
+    # All reports written during this run share one "Generated" timestamp
+    reset_run_timestamp()
+
     # Determine version for this run.
     # --version flag: use the exact version specified
     # --fresh flag (no --version): auto-increment as usual, but start clean
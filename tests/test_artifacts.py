@@ -0,0 +1,117 @@
+"""Unit tests for artifact persistence helpers in `src/artifacts.py`.
+
+Covers state snapshot round-trips on both sides of the plain/gzip size
+threshold, the per-run "Generated" timestamp shared by markdown reports, and
+batched artifact writes.
+"""
+
+from __future__ import annotations
+
+import gzip
+import itertools
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import src.artifacts as artifacts
+from src.artifacts import (
+    ArtifactBatch,
+    format_validation_report,
+    load_state_snapshot,
+    reset_run_timestamp,
+    save_state_snapshot,
+)
+
+
+def test_state_snapshot_above_threshold_round_trips_through_gzip(tmp_path, monkeypatch):
+    """A snapshot over the threshold is written as state.json.gz and read back intact."""
+    monkeypatch.setattr(artifacts, "STATE_GZIP_THRESHOLD", 1024)
+    state = {"company_name": "Acme", "research": {"notes": "x" * 4096}, "messages": ["dropped"]}
+
+    path = save_state_snapshot(tmp_path, state)
+
+    assert path == tmp_path / "state.json.gz"
+    assert not (tmp_path / "state.json").exists()
+    assert load_state_snapshot(tmp_path) == {"company_name": "Acme", "research": {"notes": "x" * 4096}}
+
+
+def test_state_snapshot_below_threshold_round_trips_as_plain_json(tmp_path):
+    """A small snapshot is written as plain state.json and read back intact."""
+    state = {"company_name": "Acme", "research": {"notes": "short"}}
+
+    path = save_state_snapshot(tmp_path, state)
+
+    assert path == tmp_path / "state.json"
+    assert not (tmp_path / "state.json.gz").exists()
+    assert load_state_snapshot(tmp_path) == state
+
+
+def test_load_state_snapshot_reads_gzip_format(tmp_path):
+    """A state.json.gz on its own is decompressed and parsed."""
+    state = {"company_name": "Acme"}
+    (tmp_path / "state.json.gz").write_bytes(gzip.compress(json.dumps(state).encode("utf-8")))
+
+    assert load_state_snapshot(tmp_path) == state
+
+
+def test_load_state_snapshot_without_snapshot_returns_none(tmp_path):
+    assert load_state_snapshot(tmp_path) is None
+
+
+class _TickingDatetime(datetime):
+    """datetime whose now() advances one minute per call."""
+
+    _ticks = itertools.count()
+
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2026, 1, 1, 12, 0) + timedelta(minutes=next(cls._ticks))
+
+
+def _generated(report: str) -> str:
+    return next(line for line in report.splitlines() if line.startswith("**Generated**"))
+
+
+def _run_job() -> list:
+    """One memo run: reset the timestamp, then write two reports."""
+    reset_run_timestamp()
+    return [_generated(format_validation_report({"overall_score": 9.0})) for _ in range(2)]
+
+
+def test_two_jobs_on_one_worker_thread_get_their_own_timestamp(monkeypatch):
+    """Jobs share the server's single worker thread; each run's reports carry its own timestamp."""
+    monkeypatch.setattr(artifacts, "datetime", _TickingDatetime)
+
+    with ThreadPoolExecutor(max_workers=1) as worker:
+        first = worker.submit(_run_job).result()
+        second = worker.submit(_run_job).result()
+
+    assert first[0] == first[1]
+    assert second[0] == second[1]
+    assert first[0] != second[0]
+
+
+def test_report_outside_a_run_does_not_reuse_another_jobs_timestamp(monkeypatch):
+    monkeypatch.setattr(artifacts, "datetime", _TickingDatetime)
+    job_headers = _run_job()
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(_generated(format_validation_report({}))))
+    thread.start()
+    thread.join()
+
+    assert other[0] != job_headers[0]
+
+
+def test_artifact_batch_writes_queued_files_on_flush(tmp_path):
+    batch = ArtifactBatch()
+    batch.add(tmp_path / "a.md", b"first")
+    batch.add(tmp_path / "b.json", b"{}")
+    batch.add(tmp_path / "a.md", "r\u00e9vis\u00e9".encode("utf-8"))
+    assert not (tmp_path / "a.md").exists()
+
+    batch.flush()
+
+    assert (tmp_path / "a.md").read_text(encoding="utf-8") == "r\u00e9vis\u00e9"
+    assert (tmp_path / "b.json").read_bytes() == b"{}"
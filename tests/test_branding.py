@@ -0,0 +1,107 @@
+"""Unit tests for brand configuration helpers in `src/branding.py`.
+
+Covers hex color validation, and loading configs through the shared YAML
+parse cache (edits picked up, loaded objects isolated from the cache), and
+the directory-mtime cache behind `list_available_brands`.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from src.branding import BrandConfig, validate_color
+
+_NESTED_BRAND_YAML = """\
+company:
+  name: Acme Ventures
+  tagline: Early-stage
+  confidential_footer: Confidential
+colors:
+  primary: "#112233"
+  secondary: "#445566"
+  background_alt: "#f5f5f5"
+  light:
+    background: "#ffffff"
+    text_body: "#222222"
+    text_header: "#111111"
+  dark:
+    background: "#000000"
+    text_body: "#eeeeee"
+fonts:
+  family: Inter
+  fallback: sans-serif
+"""
+
+
+@pytest.mark.parametrize("color", ["#fff", "#FFF", "#1a2B3c", "#000000"])
+def test_validate_color_accepts_short_and_long_hex(color):
+    assert validate_color(color)
+
+
+@pytest.mark.parametrize("color", ["fff", "#ffff", "#12345", "#1234567", "#ggg", "#12 456", "", "#"])
+def test_validate_color_rejects_malformed_values(color):
+    assert not validate_color(color)
+
+
+def test_brand_themes_are_independent_of_later_loads(tmp_path):
+    """Editing a loaded theme must not leak into the next load of the same file."""
+    config_path = tmp_path / "brand-acme-config.yaml"
+    config_path.write_text(_NESTED_BRAND_YAML, encoding="utf-8")
+
+    first = BrandConfig.load(config_path=config_path, verbose=False)
+    first.colors.light_theme["background"] = "#000000"
+    first.colors.dark_theme.clear()
+
+    second = BrandConfig.load(config_path=config_path, verbose=False)
+    assert second.colors.light_theme["background"] == "#ffffff"
+    assert second.colors.dark_theme == {"background": "#000000", "text_body": "#eeeeee"}
+
+
+def test_brand_config_edit_is_picked_up_on_next_load(tmp_path):
+    config_path = tmp_path / "brand-acme-config.yaml"
+    config_path.write_text(_NESTED_BRAND_YAML, encoding="utf-8")
+    assert BrandConfig.load(config_path=config_path, verbose=False).colors.primary == "#112233"
+
+    config_path.write_text(_NESTED_BRAND_YAML.replace("#112233", "#abcdef"), encoding="utf-8")
+
+    assert BrandConfig.load(config_path=config_path, verbose=False).colors.primary == "#abcdef"
+
+
+def test_missing_brand_config_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        BrandConfig.load(config_path=tmp_path / "brand-missing-config.yaml", verbose=False)
+
+
+def _bump_mtime(path):
+    """Move the directory mtime forward so the change is visible on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_list_available_brands_sees_new_config_after_mtime_change(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    brand_dir = tmp_path / "templates" / "brand-configs"
+    brand_dir.mkdir(parents=True)
+    (brand_dir / "brand-accel-config.yaml").write_text(_NESTED_BRAND_YAML, encoding="utf-8")
+    (tmp_path / "brand-accel-config.yaml").write_text(_NESTED_BRAND_YAML, encoding="utf-8")
+    brand = BrandConfig.get_default_config()
+
+    assert brand.list_available_brands() == ["accel"]
+
+    (brand_dir / "brand-zeta-config.yaml").write_text(_NESTED_BRAND_YAML, encoding="utf-8")
+    _bump_mtime(brand_dir)
+
+    assert brand.list_available_brands() == ["accel", "zeta"]
+
+
+def test_list_available_brands_includes_firm_configs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    firm_dir = tmp_path / "io" / "acme" / "configs"
+    firm_dir.mkdir(parents=True)
+    (firm_dir / "brand-acme-config.yaml").write_text(_NESTED_BRAND_YAML, encoding="utf-8")
+    brand = BrandConfig.get_default_config()
+
+    assert brand.list_available_brands(firm="acme") == ["acme"]
+    assert brand.list_available_brands() == []
@@ -0,0 +1,95 @@
+"""Unit tests for the corrections YAML loader in `src/corrections.py`.
+
+Covers single-pass validation and parsing in `load_corrections_yaml`, and
+isolation of parsed corrections from the shared YAML parse cache.
+"""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from src.corrections import get_correction_summary, load_corrections_yaml
+
+_CORRECTIONS_YAML = """\
+company: Acme
+source_version: v0.0.3
+output_mode: new_version
+corrections:
+  - type: inaccurate
+    inaccurate_information: The fund is raising $50M
+    correct_information: The fund is raising $10M
+    affected_sections:
+      - Executive Summary
+    sources:
+      - https://example.com/deck.pdf
+"""
+
+
+def test_corrections_lists_are_independent_of_later_loads(tmp_path):
+    """Editing a loaded correction must not leak into the next load of the same file."""
+    corrections_file = tmp_path / "Acme-corrections.yaml"
+    corrections_file.write_text(_CORRECTIONS_YAML, encoding="utf-8")
+
+    first = load_corrections_yaml(corrections_file).corrections[0]
+    first.affected_sections.append("Team")
+    first.sources.clear()
+
+    second = load_corrections_yaml(corrections_file).corrections[0]
+    assert second.affected_sections == ["Executive Summary"]
+    assert second.sources == ["https://example.com/deck.pdf"]
+
+
+def _write(tmp_path, text):
+    corrections_file = tmp_path / "Acme-corrections.yaml"
+    corrections_file.write_text(text, encoding="utf-8")
+    return corrections_file
+
+
+def test_load_corrections_yaml_parses_every_type(tmp_path):
+    corrections_file = _write(tmp_path, _CORRECTIONS_YAML + """\
+  - type: narrative
+    section: Team
+    narrative_shaping_comments:
+      - Lead with the founders' prior exit
+  - type: mixed
+    affected_sections: [Market Context, Traction & Milestones]
+    incomplete_information: Missing 2024 revenue
+    additional_information: 2024 revenue was $3M
+    update_research: true
+""")
+
+    config = load_corrections_yaml(corrections_file)
+
+    assert (config.company, config.source_version, config.output_mode) == ("Acme", "v0.0.3", "new_version")
+    assert [c.type for c in config.corrections] == ["inaccurate", "narrative", "mixed"]
+    assert config.corrections[1].narrative_comments == ["Lead with the founders' prior exit"]
+    assert config.corrections[2].update_research is True
+    assert [get_correction_summary(c) for c in config.corrections] == [
+        "Correct inaccurate info in 1 section(s)",
+        "Improve narrative in section: Team",
+        "Add missing info in 2 section(s)",
+    ]
+
+
+@pytest.mark.parametrize("text, message", [
+    (_CORRECTIONS_YAML.replace("output_mode: new_version", "output_mode: overwrite"), "Invalid output_mode"),
+    (_CORRECTIONS_YAML.replace("source_version: v0.0.3\n", ""), "Missing required field: source_version"),
+    (_CORRECTIONS_YAML.replace("type: inaccurate", "type: typo"), "Invalid type 'typo'"),
+    (_CORRECTIONS_YAML.replace("    correct_information: The fund is raising $10M\n", ""),
+     "Correction 1 (inaccurate): Missing 'correct_information'"),
+    (_CORRECTIONS_YAML.replace("      - Executive Summary\n", "").replace("affected_sections:", "affected_sections: []"),
+     "'affected_sections' must be a non-empty list"),
+    ("company: Acme\nsource_version: v0.0.3\noutput_mode: in_place\ncorrections: []\n", "cannot be empty"),
+    ("company: Acme\nsource_version: v0.0.3\noutput_mode: in_place\ncorrections:\n"
+     "  - type: mixed\n    affected_sections: [Team]\n", "Must have at least one of"),
+])
+def test_load_corrections_yaml_rejects_invalid_files(tmp_path, text, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        load_corrections_yaml(_write(tmp_path, text))
+
+
+def test_load_corrections_yaml_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Corrections file not found"):
+        load_corrections_yaml(tmp_path / "missing.yaml")
@@ -0,0 +1,70 @@
+"""Unit tests for final draft lookup in `src/final_draft.py`.
+
+Covers the naming-convention priority applied by `_scan_final_draft` and the
+directory-mtime cache in front of it in `find_final_draft`.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import src.final_draft as final_draft
+from src.final_draft import _scan_final_draft, find_final_draft
+
+_ALL_DRAFTS = ["Acme-memo.md", "4-final-draft.md", "6-Acme-v0.0.1.md", "7-Acme-v0.0.1.md"]
+
+
+@pytest.mark.parametrize("present, expected", [
+    (_ALL_DRAFTS, "7-Acme-v0.0.1.md"),
+    (_ALL_DRAFTS[:3], "6-Acme-v0.0.1.md"),
+    (_ALL_DRAFTS[:2], "4-final-draft.md"),
+    (_ALL_DRAFTS[:1], "Acme-memo.md"),
+])
+def test_scan_final_draft_prefers_newest_naming_convention(tmp_path, present, expected):
+    for name in present:
+        (tmp_path / name).write_text("# Memo\n", encoding="utf-8")
+
+    assert _scan_final_draft(tmp_path) == tmp_path / expected
+
+
+def test_scan_final_draft_without_draft_returns_none(tmp_path):
+    (tmp_path / "1-research.md").write_text("notes\n", encoding="utf-8")
+
+    assert _scan_final_draft(tmp_path) is None
+
+
+def test_scan_final_draft_missing_directory_returns_none(tmp_path):
+    assert _scan_final_draft(tmp_path / "missing") is None
+
+
+def _bump_mtime(path):
+    """Move the directory mtime forward so the change is visible on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_find_final_draft_reuses_scan_while_directory_unchanged(tmp_path, monkeypatch):
+    (tmp_path / "Acme-memo.md").write_text("# Memo\n", encoding="utf-8")
+    scans = []
+    real_scan = final_draft._scan_final_draft
+    monkeypatch.setattr(final_draft, "_scan_final_draft", lambda d: scans.append(d) or real_scan(d))
+
+    assert find_final_draft(tmp_path) == tmp_path / "Acme-memo.md"
+    assert find_final_draft(tmp_path) == tmp_path / "Acme-memo.md"
+    assert len(scans) == 1
+
+
+def test_find_final_draft_rescans_after_directory_changes(tmp_path):
+    (tmp_path / "Acme-memo.md").write_text("# Memo\n", encoding="utf-8")
+    assert find_final_draft(tmp_path) == tmp_path / "Acme-memo.md"
+
+    (tmp_path / "7-Acme-v0.0.1.md").write_text("# Memo\n", encoding="utf-8")
+    _bump_mtime(tmp_path)
+
+    assert find_final_draft(tmp_path) == tmp_path / "7-Acme-v0.0.1.md"
+
+
+def test_find_final_draft_missing_directory_returns_none(tmp_path):
+    assert find_final_draft(tmp_path / "missing") is None
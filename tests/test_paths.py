@@ -0,0 +1,47 @@
+"""Unit tests for output directory resolution in `src/paths.py`.
+
+Covers the outputs-directory mtime cache in `find_latest_version_dir`.
+"""
+
+from __future__ import annotations
+
+import os
+
+from src.paths import find_latest_version_dir
+
+
+def _bump_mtime(path):
+    """Move the directory mtime forward so the change is visible on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_find_latest_version_dir_picks_highest_version(tmp_path):
+    for name in ("Acme-v0.0.1", "Acme-v0.0.3", "Acme-v0.0.2", "Other-v0.0.9"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "Acme-v0.0.9.md").write_text("not a directory\n", encoding="utf-8")
+
+    assert find_latest_version_dir(tmp_path, "Acme") == tmp_path / "Acme-v0.0.3"
+
+
+def test_find_latest_version_dir_sees_new_version_after_mtime_change(tmp_path):
+    (tmp_path / "Acme-v0.0.1").mkdir()
+    assert find_latest_version_dir(tmp_path, "Acme") == tmp_path / "Acme-v0.0.1"
+
+    (tmp_path / "Acme-v0.0.2").mkdir()
+    _bump_mtime(tmp_path)
+
+    assert find_latest_version_dir(tmp_path, "Acme") == tmp_path / "Acme-v0.0.2"
+
+
+def test_find_latest_version_dir_caches_per_deal_name(tmp_path):
+    (tmp_path / "Acme-v0.0.1").mkdir()
+    (tmp_path / "Beta-v0.0.4").mkdir()
+
+    assert find_latest_version_dir(tmp_path, "Acme") == tmp_path / "Acme-v0.0.1"
+    assert find_latest_version_dir(tmp_path, "Beta") == tmp_path / "Beta-v0.0.4"
+    assert find_latest_version_dir(tmp_path, "Gamma") is None
+
+
+def test_find_latest_version_dir_missing_outputs_dir_returns_none(tmp_path):
+    assert find_latest_version_dir(tmp_path / "missing", "Acme") is None
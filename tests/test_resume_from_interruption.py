@@ -0,0 +1,49 @@
+"""Unit tests for the resume entry point in `cli/resume_from_interruption.py`.
+
+Covers the per-run "Generated" timestamp when several resumed jobs run in one
+long-lived process, as they do in the API server.
+"""
+
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("langchain_anthropic")  # imported by the agents being resumed
+
+import src.artifacts as artifacts
+import src.workflow as workflow
+from cli.resume_from_interruption import execute_from_checkpoint
+from src.artifacts import format_validation_report
+
+
+class _TickingDatetime(datetime):
+    """datetime whose now() advances one minute per call."""
+
+    _ticks = itertools.count()
+
+    @classmethod
+    def now(cls, tz=None):
+        return datetime(2026, 1, 1, 12, 0) + timedelta(minutes=next(cls._ticks))
+
+
+def test_resumed_jobs_in_one_process_get_their_own_timestamp(monkeypatch):
+    """Each execute_from_checkpoint call starts a new run, like generate_memo does."""
+    monkeypatch.setattr(artifacts, "datetime", _TickingDatetime)
+
+    def finalize(state):
+        reports = [format_validation_report({"overall_score": 9.0}) for _ in range(2)]
+        return {"generated": [report.splitlines()[2] for report in reports]}
+
+    monkeypatch.setattr(workflow, "finalize_memo", finalize)
+
+    with ThreadPoolExecutor(max_workers=1) as worker:
+        first = worker.submit(execute_from_checkpoint, {}, "finalize").result()["generated"]
+        second = worker.submit(execute_from_checkpoint, {}, "finalize").result()["generated"]
+
+    assert first[0] == first[1]
+    assert second[0] == second[1]
+    assert first[0] != second[0]
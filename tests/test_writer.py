@@ -0,0 +1,161 @@
+"""Unit tests for the writer agent's polish short-circuit in `src/agents/writer.py`.
+
+Covers `research_meets_style_targets` (word-count range and citation-key
+coverage), the `WRITER_SKIP_POLISH_IF_CLEAN` opt-in that uses it, and the
+Message Batch path in `run_message_batch`.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+anthropic = pytest.importorskip("anthropic")
+pytest.importorskip("langchain_anthropic")  # imported by src.agents
+
+import httpx  # installed with anthropic
+
+import src.agents.writer as writer
+from src.agents.writer import polish_section_research, research_meets_style_targets, run_message_batch
+from src.schemas.outline_schema import SectionDefinition, SectionVocabulary, TargetLength
+
+
+def _section(min_words: int = 5, max_words: int = 50) -> SectionDefinition:
+    return SectionDefinition(
+        number=1,
+        name="Executive Summary",
+        filename="01-executive-summary.md",
+        target_length=TargetLength(min_words=min_words, max_words=max_words, ideal_words=max_words),
+        description="Summary",
+        guiding_questions=[],
+        section_vocabulary=SectionVocabulary(),
+        mode_specific={},
+        validation_criteria=[],
+    )
+
+
+def _research(words: int, inline_key: str = "1", defined_key: str = "1") -> str:
+    prose = " ".join(["word"] * (words - 1)) + f" claim[^{inline_key}]."
+    return f"{prose}\n### Citations\n\n[^{defined_key}]: Source, 2024.\n"
+
+
+def test_research_in_word_range_with_defined_citations_passes():
+    assert research_meets_style_targets(_section(), _research(20))
+
+
+@pytest.mark.parametrize("words", [2, 80])
+def test_research_outside_word_range_fails(words):
+    assert not research_meets_style_targets(_section(min_words=5, max_words=50), _research(words))
+
+
+def test_research_padding_does_not_count_as_words():
+    """Blank lines, double spaces and table padding add no words to the count."""
+    prose = "Revenue  grew   fast.\n\n\n|  ARR   |  $2M   |\n\nSee claim[^1].\n"
+    research = f"{prose}### Citations\n\n[^1]: Source, 2024.\n"
+
+    assert not research_meets_style_targets(_section(min_words=11), research)
+    assert research_meets_style_targets(_section(min_words=10), research)
+
+
+def test_research_with_undefined_citation_key_fails():
+    assert not research_meets_style_targets(_section(), _research(20, inline_key="2", defined_key="1"))
+
+
+def test_research_without_citations_block_fails():
+    assert not research_meets_style_targets(_section(), "word " * 20)
+
+
+@pytest.mark.parametrize("env_value, expected_calls", [(None, 1), ("true", 0)])
+def test_skip_polish_if_clean_env_controls_llm_call(monkeypatch, env_value, expected_calls):
+    """Clean research only bypasses the polish call when the env flag is set."""
+    calls = []
+
+    def fake_invoke(model, prompt, stream_path=None):
+        calls.append(prompt)
+        return research
+
+    if env_value is None:
+        monkeypatch.delenv("WRITER_SKIP_POLISH_IF_CLEAN", raising=False)
+    else:
+        monkeypatch.setenv("WRITER_SKIP_POLISH_IF_CLEAN", env_value)
+    monkeypatch.setattr(writer, "_invoke_streaming", fake_invoke)
+    research = _research(20)
+
+    result = polish_section_research(_section(), research, "Acme", "consider", "", model=None)
+
+    assert len(calls) == expected_calls
+    if expected_calls == 0:
+        assert result == research
+
+
+class _FakeBatches:
+    """Stand-in for client.messages.batches; the batch ends after `polls_to_end` retrieves."""
+
+    def __init__(self, polls_to_end=1, create_error=None):
+        self.polls_to_end = polls_to_end
+        self.create_error = create_error
+        self.cancelled = []
+
+    def create(self, requests):
+        if self.create_error is not None:
+            raise self.create_error
+        self.custom_ids = [request["custom_id"] for request in requests]
+        return SimpleNamespace(id="batch-1", processing_status="in_progress")
+
+    def retrieve(self, batch_id):
+        self.polls_to_end -= 1
+        return SimpleNamespace(id=batch_id, processing_status="ended" if self.polls_to_end <= 0 else "in_progress")
+
+    def cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+
+    def results(self, batch_id):
+        for custom_id in self.custom_ids:
+            if custom_id == "section-2":
+                yield SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type="errored"))
+                continue
+            content = [SimpleNamespace(type="text", text=f" {custom_id} text ")]
+            yield SimpleNamespace(
+                custom_id=custom_id,
+                result=SimpleNamespace(type="succeeded", message=SimpleNamespace(content=content)),
+            )
+
+
+def _use_batches(monkeypatch, batches):
+    """Route run_message_batch to fake batches and a clock that advances on sleep."""
+    clock = SimpleNamespace(now=0.0)
+
+    def sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr(writer, "_get_client", lambda: SimpleNamespace(messages=SimpleNamespace(batches=batches)))
+    monkeypatch.setattr(writer, "time", SimpleNamespace(sleep=sleep, monotonic=lambda: clock.now))
+
+
+_PROMPTS = {"section-1": "p1", "section-2": "p2", "section-3": "p3"}
+
+
+def test_run_message_batch_returns_succeeded_results_only(monkeypatch):
+    _use_batches(monkeypatch, _FakeBatches(polls_to_end=3))
+
+    results = run_message_batch(_PROMPTS, "model", 100, 0.0, poll_interval=1.0)
+
+    assert results == {"section-1": "section-1 text", "section-3": "section-3 text"}
+
+
+def test_run_message_batch_cancels_and_falls_back_after_max_wait(monkeypatch):
+    batches = _FakeBatches(polls_to_end=10**6)
+    _use_batches(monkeypatch, batches)
+
+    results = run_message_batch(_PROMPTS, "model", 100, 0.0, poll_interval=10.0, max_wait=60.0)
+
+    assert results == {}
+    assert batches.cancelled == ["batch-1"]
+
+
+def test_run_message_batch_falls_back_when_submission_fails(monkeypatch):
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages/batches")
+    _use_batches(monkeypatch, _FakeBatches(create_error=anthropic.APIConnectionError(request=request)))
+
+    assert run_message_batch(_PROMPTS, "model", 100, 0.0) == {}